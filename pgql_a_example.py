@@ -13,18 +13,35 @@ from pysui.sui.sui_pgql.pgql_async_txn import AsyncSuiTransaction
 import pysui.sui.sui_pgql.pgql_query as qn
 import pysui.sui.sui_pgql.pgql_types as ptypes
 
+# orjson is optional, it pretty prints large results much faster
+try:
+    import orjson
+
+    def _to_json(data) -> str:
+        """Pretty print JSON of a result dataclass."""
+        return orjson.dumps(
+            data.to_dict(encode_json=True),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+except ImportError:
+
+    def _to_json(data) -> str:
+        """Pretty print JSON of a result dataclass."""
+        return data.to_json(indent=2)
+
 
 def handle_result(result: SuiRpcResult) -> SuiRpcResult:
     """."""
     if result.is_ok():
         if hasattr(result.result_data, "to_json"):
-            print(result.result_data.to_json(indent=2))
+            print(_to_json(result.result_data))
         else:
             print(result.result_data)
     else:
         print(result.result_string)
         if result.result_data and hasattr(result.result_data, "to_json"):
-            print(result.result_data.to_json(indent=2))
+            print(_to_json(result.result_data))
         else:
             print(result.result_data)
     return result
@@ -122,15 +139,16 @@ async def do_all_balances(client: AsyncGqlClient):
 
     Demonstrates paging as well
     """
+    owner = client.config.active_address
     result = await client.execute_query_node(
-        with_node=qn.GetAllCoinBalances(owner=client.config.active_address)
+        with_node=qn.GetAllCoinBalances(owner=owner)
     )
     handle_result(result)
     if result.is_ok():
         while result.result_data.next_cursor.hasNextPage:
             result = await client.execute_query_node(
                 with_node=qn.GetAllCoinBalances(
-                    owner=client.config.active_address,
+                    owner=owner,
                     next_page=result.result_data.next_cursor,
                 )
             )
@@ -185,22 +203,47 @@ async def do_multiple_object_versions(client: AsyncGqlClient):
     )
 
 
-async def do_objects_for(client: AsyncGqlClient):
+async def do_objects_for(client: AsyncGqlClient, shard: int = 16):
     """Fetch specific objects by their ids.
 
+    The ids are split into shards fetched concurrently, each shard pages through
+    its results. Objects are printed in shard order.
+
     These are test IDs, replace to run.
     """
-    handle_result(
-        await client.execute_query_node(
-            with_node=qn.GetMultipleObjects(
-                object_ids=[
-                    "0x0847e1e02965e3f6a8b237152877a829755fd2f7cfb7da5a859f203a8d4316f0",
-                    "0x68e961e3af906b160e1ff21137304537fa6b31f5a4591ef3acf9664eb6e3cd2b",
-                    "0x77851d73e7c1227c048fc7cbf21ff9053faa872950dd33f5d0cb5b40a79d9d99",
-                ]
-            )
+    object_ids = [
+        "0x0847e1e02965e3f6a8b237152877a829755fd2f7cfb7da5a859f203a8d4316f0",
+        "0x68e961e3af906b160e1ff21137304537fa6b31f5a4591ef3acf9664eb6e3cd2b",
+        "0x77851d73e7c1227c048fc7cbf21ff9053faa872950dd33f5d0cb5b40a79d9d99",
+    ]
+
+    async def _shard_objects(ids: list[str]) -> list[ptypes.ObjectReadGQL]:
+        objects: list[ptypes.ObjectReadGQL] = []
+        result = await client.execute_query_node(
+            with_node=qn.GetMultipleObjects(object_ids=ids)
         )
+        while result.is_ok():
+            objects.extend(result.result_data.data)
+            if not result.result_data.next_cursor.hasNextPage:
+                break
+            result = await client.execute_query_node(
+                with_node=qn.GetMultipleObjects(
+                    object_ids=ids, next_page=result.result_data.next_cursor
+                )
+            )
+        if not result.is_ok():
+            raise ValueError(result.result_string)
+        return objects
+
+    shards = await asyncio.gather(
+        *[
+            _shard_objects(object_ids[index : index + shard])
+            for index in range(0, len(object_ids), shard)
+        ]
     )
+    for shard_objects in shards:
+        for sobject in shard_objects:
+            print(_to_json(sobject))
 
 
 async def do_dynamics(client: AsyncGqlClient):
@@ -265,7 +308,7 @@ async def do_txs(client: AsyncGqlClient):
         in_page = 0
         while True:
             in_page += 1
-            if in_page < max_page and result.result_data.next_cursor:
+            if in_page < max_page and result.result_data.next_cursor.hasNextPage:
                 result = await client.execute_query_node(
                     with_node=qn.GetMultipleTx(next_page=result.result_data.next_cursor)
                 )
@@ -620,6 +663,19 @@ async def do_unstake(client: AsyncGqlClient):
         print(f"No staked Sui for {owner}")
 
 
+async def do_concurrent(client: AsyncGqlClient):
+    """Run independent examples concurrently.
+
+    Total time is that of the slowest example rather than the sum of all.
+    """
+    await asyncio.gather(
+        do_coin_meta(client),
+        do_sysstate(client),
+        do_latest_cp(client),
+        do_refgas(client),
+    )
+
+
 async def main():
     """."""
     try:
@@ -641,6 +697,7 @@ async def main():
         await do_gas(client_init)
         # await do_all_gas(client_init)
         # await do_gas_ids(client_init)
+        # await do_concurrent(client_init)
         # await do_sysstate(client_init)
         # await do_all_balances(client_init)
         # await do_object(client_init)
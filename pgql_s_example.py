@@ -12,18 +12,35 @@ from pysui.sui.sui_pgql.pgql_sync_txn import SuiTransaction
 import pysui.sui.sui_pgql.pgql_query as qn
 import pysui.sui.sui_pgql.pgql_types as ptypes
 
+# orjson is optional, it pretty prints large results much faster
+try:
+    import orjson
+
+    def _to_json(data) -> str:
+        """Pretty print JSON of a result dataclass."""
+        return orjson.dumps(
+            data.to_dict(encode_json=True),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+except ImportError:
+
+    def _to_json(data) -> str:
+        """Pretty print JSON of a result dataclass."""
+        return data.to_json(indent=2)
+
 
 def handle_result(result: SuiRpcResult) -> SuiRpcResult:
     """."""
     if result.is_ok():
         if hasattr(result.result_data, "to_json"):
-            print(result.result_data.to_json(indent=2))
+            print(_to_json(result.result_data))
         else:
             print(result.result_data)
     else:
         print(result.result_string)
         if result.result_data and hasattr(result.result_data, "to_json"):
-            print(result.result_data.to_json(indent=2))
+            print(_to_json(result.result_data))
         else:
             print(result.result_data)
     return result
@@ -35,6 +52,21 @@ def do_coin_meta(client: SyncGqlClient):
     handle_result(client.execute_query_node(with_node=qn.GetCoinMetaData()))
 
 
+def do_batched_queries(client: SyncGqlClient):
+    """Fetch independent queries in one request.
+
+    Each QueryNode gets its own result, in order.
+    """
+    for result in client.execute_query_nodes(
+        with_nodes=[
+            qn.GetCoinMetaData(),
+            qn.GetLatestCheckpointSequence(),
+            qn.GetReferenceGasPrice(),
+        ]
+    ):
+        handle_result(result)
+
+
 def do_coins_for_type(client: SyncGqlClient):
     """Fetch coins of specific type for owner."""
     handle_result(
@@ -116,15 +148,14 @@ def do_all_balances(client: SyncGqlClient):
 
     Demonstrates paging as well
     """
-    result = client.execute_query_node(
-        with_node=qn.GetAllCoinBalances(owner=client.config.active_address)
-    )
+    owner = client.config.active_address
+    result = client.execute_query_node(with_node=qn.GetAllCoinBalances(owner=owner))
     handle_result(result)
     if result.is_ok():
         while result.result_data.next_cursor.hasNextPage:
             result = client.execute_query_node(
                 with_node=qn.GetAllCoinBalances(
-                    owner=client.config.active_address,
+                    owner=owner,
                     next_page=result.result_data.next_cursor,
                 )
             )
@@ -285,7 +316,7 @@ def do_txs(client: SyncGqlClient):
         in_page = 0
         while True:
             in_page += 1
-            if in_page < max_page and result.result_data.next_cursor:
+            if in_page < max_page and result.result_data.next_cursor.hasNextPage:
                 result = client.execute_query_node(
                     with_node=qn.GetMultipleTx(next_page=result.result_data.next_cursor)
                 )
@@ -707,6 +738,7 @@ if __name__ == "__main__":
         #     print(pname)
         ## QueryNodes (fetch)
         # do_coin_meta(client_init)
+        # do_batched_queries(client_init)
         # do_coins_for_type(client_init)
         do_gas(client_init)
         # do_all_gas(client_init)
@@ -757,4 +789,4 @@ if __name__ == "__main__":
     except Exception as ex:
         print(ex.args)
     if client_init:
-        client_init.client().close_sync()
+        client_init.close()
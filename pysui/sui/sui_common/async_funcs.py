@@ -207,11 +207,7 @@ async def merge_sui(
     use_as_gas = coin_list.pop(0)
     logger.debug(f"{len(coin_list)} coins merging to {use_as_gas.coin_object_id}")
     await tx.merge_coins(merge_to=tx.gas, merge_from=coin_list)
-    res = await client.execute_query_node(
-        with_node=qn.ExecuteTransaction(
-            **await tx.build_and_sign(use_gas_objects=[use_as_gas])
-        )
-    )
+    res = await tx.execute(use_gas_objects=[use_as_gas])
     if res.is_err():
         logger.warn(f"merge_all_sui transaction failed {res.result_string}")
         raise ValueError(f"Failed smashing coins with {res.result_string}")
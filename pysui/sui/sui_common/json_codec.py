@@ -0,0 +1,14 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""JSON decoding, using orjson when installed."""
+
+# orjson is optional, both decoders accept str and bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+__all__ = ["json_loads"]
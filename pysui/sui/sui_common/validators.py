@@ -19,7 +19,7 @@ from pysui.sui.sui_constants import (
 )
 
 
-__partstring_pattern: re.Pattern = re.compile(r"[0-9a-fA-F]{1,64}")
+__hexstring_pattern: re.Pattern = re.compile(r"[0-9a-fA-F]+")
 
 
 @versionadded(
@@ -35,15 +35,12 @@ def valid_sui_address(instr: str) -> bool:
         case "Immutable":
             return True
         case _:
-            if inlen < 3 and (instr.count("x") or instr.count("X")):
-                return False
-            if instr.count("x") or instr.count("X"):
+            if "x" in instr or "X" in instr:
+                if inlen < 3:
+                    return False
                 instr = instr[2:]
-            re_res = __partstring_pattern.findall(instr)
-            if re_res:
-                if len("".join(re_res)) == len(instr):
-                    return True
-            return False
+            # Single scan of the hex digits in C
+            return __hexstring_pattern.fullmatch(instr) is not None
 
 
 class ValidateAlias(argparse.Action):
@@ -15,6 +15,16 @@ import pysui.sui.sui_crypto as crypto
 import pysui.sui.sui_utils as utils
 from pysui.sui.sui_constants import SUI_MAX_ALIAS_LEN, SUI_MIN_ALIAS_LEN
 
+# Initialized hasher, copied for each address derivation
+_ADDRESS_HASHER = hashlib.blake2b(digest_size=32)
+
+
+def _address_from_digest(digest: bytes) -> str:
+    """Derive a Sui address from scheme flag and public key bytes."""
+    hasher = _ADDRESS_HASHER.copy()
+    hasher.update(digest)
+    return f"0x{hasher.hexdigest()}"
+
 
 @dataclasses.dataclass
 class ProfileAlias(dataclasses_json.DataClassJsonMixin):
@@ -23,6 +33,15 @@ class ProfileAlias(dataclasses_json.DataClassJsonMixin):
     alias: str
     public_key_base64: str
 
+    @classmethod
+    def from_dict(cls, kvs: dict, *, infer_missing=False) -> "ProfileAlias":
+        """Create from dictionary."""
+        return cls(kvs["alias"], kvs["public_key_base64"])
+
+    def to_dict(self, encode_json=False) -> dict:
+        """Return as dictionary."""
+        return {"alias": self.alias, "public_key_base64": self.public_key_base64}
+
 
 @dataclasses.dataclass
 class ProfileKey(dataclasses_json.DataClassJsonMixin):
@@ -30,6 +49,26 @@ class ProfileKey(dataclasses_json.DataClassJsonMixin):
 
     private_key_base64: str
 
+    def __post_init__(self):
+        """Defer keystring decoding until the keypair is needed."""
+        self._keypair: Optional[crypto.SuiKeyPair] = None
+
+    @property
+    def keypair(self) -> crypto.SuiKeyPair:
+        """Return the keypair, decoding the keystring on first use only."""
+        if self._keypair is None:
+            self._keypair = crypto.keypair_from_keystring(self.private_key_base64)
+        return self._keypair
+
+    @classmethod
+    def from_dict(cls, kvs: dict, *, infer_missing=False) -> "ProfileKey":
+        """Create from dictionary."""
+        return cls(kvs["private_key_base64"])
+
+    def to_dict(self, encode_json=False) -> dict:
+        """Return as dictionary."""
+        return {"private_key_base64": self.private_key_base64}
+
 
 @dataclasses.dataclass
 class Profile(dataclasses_json.DataClassJsonMixin):
@@ -40,10 +79,34 @@ class Profile(dataclasses_json.DataClassJsonMixin):
     faucet_url: Optional[str] = None
     faucet_status_url: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, kvs: dict, *, infer_missing=False) -> "Profile":
+        """Create from dictionary."""
+        return cls(
+            kvs["profile_name"],
+            kvs["url"],
+            kvs.get("faucet_url"),
+            kvs.get("faucet_status_url"),
+        )
+
+    def to_dict(self, encode_json=False) -> dict:
+        """Return as dictionary."""
+        return {
+            "profile_name": self.profile_name,
+            "url": self.url,
+            "faucet_url": self.faucet_url,
+            "faucet_status_url": self.faucet_status_url,
+        }
+
 
 @dataclasses.dataclass
 class ProfileGroup(dataclasses_json.DataClassJsonMixin):
-    """Represents a group of profile."""
+    """Represents a group of profile.
+
+    alias_list, key_list and address_list are parallel, entry i of each describes
+    the same keypair. Lookups by address, alias or key resolve to that position
+    through dictionary indexes kept alongside the lists.
+    """
 
     group_name: str
     using_profile: str
@@ -53,28 +116,77 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
     address_list: Optional[list[str]] = dataclasses.field(default_factory=list)
     profiles: Optional[list[Profile]] = dataclasses.field(default_factory=list)
 
+    def __post_init__(self):
+        """Build the lookup indexes."""
+        self._reindex()
+
+    def _reindex(self):
+        """Rebuild the address, alias, key and profile lookup indexes."""
+        self._addr_to_idx: dict[str, int] = {
+            x: i for i, x in enumerate(self.address_list)
+        }
+        self._alias_to_idx: dict[str, int] = {
+            x.alias: i for i, x in enumerate(self.alias_list)
+        }
+        self._key_to_idx: dict[str, int] = {
+            x.private_key_base64: i for i, x in enumerate(self.key_list)
+        }
+        self._prof_by_name: dict[str, Profile] = {
+            x.profile_name: x for x in self.profiles
+        }
+
+    def _index_keypair(self, index: int):
+        """Add the address, alias and key at index to the lookup indexes."""
+        self._addr_to_idx[self.address_list[index]] = index
+        self._alias_to_idx[self.alias_list[index].alias] = index
+        self._key_to_idx[self.key_list[index].private_key_base64] = index
+
+    @classmethod
+    def from_dict(cls, kvs: dict, *, infer_missing=False) -> "ProfileGroup":
+        """Create from dictionary.
+
+        Explicit construction avoids dataclasses_json per field reflection, which
+        dominates loading configurations with many keys.
+        """
+        return cls(
+            kvs["group_name"],
+            kvs["using_profile"],
+            kvs["using_address"],
+            [ProfileAlias.from_dict(x) for x in kvs["alias_list"]],
+            [ProfileKey.from_dict(x) for x in kvs["key_list"]],
+            list(kvs.get("address_list", [])),
+            [Profile.from_dict(x) for x in kvs.get("profiles", [])],
+        )
+
+    def to_dict(self, encode_json=False) -> dict:
+        """Return as dictionary."""
+        return {
+            "group_name": self.group_name,
+            "using_profile": self.using_profile,
+            "using_address": self.using_address,
+            "alias_list": [x.to_dict() for x in self.alias_list],
+            "key_list": [x.to_dict() for x in self.key_list],
+            "address_list": list(self.address_list),
+            "profiles": [x.to_dict() for x in self.profiles],
+        }
+
     def _profile_exists(self, *, profile_name: str) -> Union[Profile, bool]:
         """Check if a profile, by name, exists."""
-        return next(
-            filter(lambda prf: prf.profile_name == profile_name, self.profiles), False
-        )
+        return self._prof_by_name.get(profile_name, False)
 
     def _alias_exists(self, *, alias_name: str) -> Union[ProfileAlias, bool]:
         """Check if an alias, by name, exists."""
-        return next(
-            filter(lambda ally: ally.alias == alias_name, self.alias_list), False
-        )
+        aliindx = self._alias_to_idx.get(alias_name)
+        return False if aliindx is None else self.alias_list[aliindx]
 
     def _address_exists(self, *, address: str) -> Union[str, bool]:
         """Check if address is valid."""
-        return next(filter(lambda addy: addy == address, self.address_list), False)
+        return address if address in self._addr_to_idx else False
 
     def _key_exists(self, *, key_string: str) -> Union[ProfileKey, bool]:
         """Check if key string exists."""
-        return next(
-            filter(lambda pkey: pkey.private_key_base64 == key_string, self.key_list),
-            False,
-        )
+        keyindx = self._key_to_idx.get(key_string)
+        return False if keyindx is None else self.key_list[keyindx]
 
     @property
     def active_address(self) -> str:
@@ -84,59 +196,58 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
     @active_address.setter
     def active_address(self, change_to: str) -> str:
         """Set the using address to change_to."""
-        _ = self.address_list.index(change_to)
+        if change_to not in self._addr_to_idx:
+            raise ValueError(f"{change_to} is not in list")
         self.using_address = change_to
         return change_to
 
     @property
     def active_alias(self) -> str:
         """Return the alias associated to the using (active) address."""
-        adex = self.address_list.index(self.using_address)
+        adex = self._addr_to_idx.get(self.using_address)
+        if adex is None:
+            raise ValueError(f"{self.using_address} is not in list")
         return self.alias_list[adex].alias
 
     @active_alias.setter
     def active_alias(self, change_to: str) -> str:
         """Change the alias that is active."""
         # Find the index of the change_to alias
-        _res = self._alias_exists(alias_name=change_to)
-        if _res:
-            aliindx = self.alias_list.index(_res)
+        aliindx = self._alias_to_idx.get(change_to)
+        if aliindx is not None:
             self.using_address = self.address_list[aliindx]
-            return _res.alias
+            return change_to
         raise ValueError(f"Alias {change_to} not found in group")
 
     def address_for_alias(self, *, alias: str) -> str:
         """Get address associated with alias."""
-        _res = self._alias_exists(alias_name=alias)
-        if _res:
-            aliindx = self.alias_list.index(_res)
+        aliindx = self._alias_to_idx.get(alias)
+        if aliindx is not None:
             return self.address_list[aliindx]
         raise ValueError(f"Alias {alias} not found in group")
 
     def alias_for_address(self, *, address: str) -> ProfileAlias:
         """Get alias associated with address."""
-        _res = self._address_exists(address=address)
-        if _res:
-            adindex = self.address_list.index(_res)
+        adindex = self._addr_to_idx.get(address)
+        if adindex is not None:
             return self.alias_list[adindex]
         raise ValueError(f"Address {address} not found in group")
 
     def alias_name_for_address(self, *, address: str) -> str:
         """Get alias associated with address."""
-        _res = self._address_exists(address=address)
-        if _res:
-            adindex = self.address_list.index(_res)
+        adindex = self._addr_to_idx.get(address)
+        if adindex is not None:
             return self.alias_list[adindex].alias
         raise ValueError(f"Address {address} not found in group")
 
     def replace_alias_name(self, *, from_alias: str, to_alias: str) -> str:
         """Replace alias name and return associated address."""
-        _res = self._alias_exists(alias_name=from_alias)
-        if _res:
-            _rese = self._alias_exists(alias_name=to_alias)
-            if not _rese:
-                aliindx = self.alias_list.index(_res)
-                _res.alias = to_alias
+        aliindx = self._alias_to_idx.get(from_alias)
+        if aliindx is not None:
+            if to_alias not in self._alias_to_idx:
+                self.alias_list[aliindx].alias = to_alias
+                del self._alias_to_idx[from_alias]
+                self._alias_to_idx[to_alias] = aliindx
                 return self.address_list[aliindx]
             raise ValueError(f"Alias {to_alias} already exists")
         raise ValueError(f"Alias {from_alias} not found in group")
@@ -173,25 +284,23 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
 
     def keypair_for_address(self, *, address: str) -> crypto.SuiKeyPair:
         """Fetch an addresses KeyPair."""
-        _res = self._address_exists(address=address)
-        if _res:
-            return crypto.keypair_from_keystring(
-                self.key_list[self.address_list.index(_res)].private_key_base64
-            )
+        adindex = self._addr_to_idx.get(address)
+        if adindex is not None:
+            return self.key_list[adindex].keypair
         raise ValueError(f"Keypair for address: {address} does not exist.")
 
     @staticmethod
     def _alias_check_or_gen(
         *,
-        aliases: Optional[list[str]] = None,
+        aliases: Optional[set[str]] = None,
         word_counts: Optional[int] = 12,
         alias: Optional[str] = None,
         current_iter: Optional[int] = 0,
     ) -> str:
         """_alias_check_or_gen If alias is provided, checks if unique otherwise creates one or more.
 
-        :param aliases: List of existing aliases, defaults to None
-        :type aliases: list[str], optional
+        :param aliases: Set of existing alias names, defaults to None
+        :type aliases: set[str], optional
         :param word_counts: Words count used for mnemonic phrase, defaults to 12
         :type word_counts: Optional[int], optional
         :param alias: An inbound alias, defaults to None
@@ -201,6 +310,7 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         :return: An aliases
         :rtype: str
         """
+        aliases = aliases or set()
         if not alias:
             parts = list(
                 utils.partition(
@@ -208,18 +318,12 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
                     int(word_counts / 2),
                 )
             )
-            alias_names = [k + "-" + v for k, v in zip(*parts)]
-
-            # alias_names = self._alias_gen_batch(word_counts=word_counts)
-            # Find a unique part if just_one
-            if not aliases:
-                alias = alias_names[0]
-            else:
-                for alias_name in alias_names:
-                    if alias_name not in aliases:
-                        # Found one
-                        alias = alias_name
-                        break
+            # Take the first unique pairing
+            for k, v in zip(*parts):
+                alias_name = f"{k}-{v}"
+                if alias_name not in aliases:
+                    alias = alias_name
+                    break
             # If all match (unlikely), try unless threshold
             if not alias:
                 if current_iter > 2:
@@ -270,20 +374,23 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         )
         _new_keystr = keypair.serialize()
         _new_prf_key = ProfileKey(_new_keystr)
+        _new_prf_key._keypair = keypair
         # Generate artifacts
         _pkey_bytes = keypair.to_bytes()
         _digest = _pkey_bytes[0:33] if _pkey_bytes[0] == 0 else _pkey_bytes[0:34]
         # ProfileAlias Entry
         if not alias:
             alias = ProfileGroup._alias_check_or_gen(
-                aliases=alias_list, alias=alias, word_counts=word_counts
+                aliases={x.alias for x in alias_list},
+                alias=alias,
+                word_counts=word_counts,
             )
 
         _new_alias = ProfileAlias(
             alias,
             base64.b64encode(keypair.public_key.scheme_and_key()).decode(),
         )
-        _new_addy = format(f"0x{hashlib.blake2b(_digest, digest_size=32).hexdigest()}")
+        _new_addy = _address_from_digest(_digest)
         return mnem, _new_addy, _new_prf_key, _new_alias
 
     def add_keypair_and_parts(
@@ -305,6 +412,7 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
             self.address_list.append(new_address)
             self.key_list.append(new_key)
             self.alias_list.append(new_alias)
+            self._index_keypair(len(self.address_list) - 1)
 
             if make_active:
                 self.using_address = new_address
@@ -322,7 +430,7 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         addies: list[str] = []
         _pfkey: list[ProfileKey] = []
         _pfalias: list[ProfileAlias] = []
-        _alias_list = [x.alias for x in self.alias_list]
+        _alias_set = set(self._alias_to_idx)
         for key in keys:
             # Set key and address
             _kp = crypto.keypair_from_keystring(key["key_string"])
@@ -331,21 +439,17 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
             if _res:
                 raise ValueError(f"Key string {_kstr} already exists.")
             _pfkey.append(ProfileKey(_kstr))
+            _pfkey[-1]._keypair = _kp
             _pkey_bytes = _kp.to_bytes()
             _digest = _pkey_bytes[0:33] if _pkey_bytes[0] == 0 else _pkey_bytes[0:34]
-            addies.append(
-                format(f"0x{hashlib.blake2b(_digest, digest_size=32).hexdigest()}")
-            )
+            addies.append(_address_from_digest(_digest))
             # Set alias for key
             _alias = key.get("alias", None)
             if not _alias:
-                _alias = ProfileGroup._alias_check_or_gen(aliases=_alias_list)
-            else:
-                _res = self._alias_exists(alias_name=_alias)
-                if _res:
-                    raise ValueError(
-                        f"{_alias} associated to {key['key_string']} exists"
-                    )
+                _alias = ProfileGroup._alias_check_or_gen(aliases=_alias_set)
+            elif _alias in _alias_set:
+                raise ValueError(f"{_alias} associated to {key['key_string']} exists")
+            _alias_set.add(_alias)
             _pfalias.append(
                 ProfileAlias(
                     _alias, base64.b64encode(_kp.public_key.scheme_and_key()).decode()
@@ -353,9 +457,12 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
             )
 
         # Extend the group
+        _start = len(self.address_list)
         self.key_list.extend(_pfkey)
         self.address_list.extend(addies)
         self.alias_list.extend(_pfalias)
+        for index in range(_start, len(self.address_list)):
+            self._index_keypair(index)
         return addies
 
     def add_profile(self, *, new_prf: Profile, make_active: bool = False):
@@ -364,6 +471,7 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         if _res:
             raise ValueError(f"Profile {new_prf.profile_name} already exists.")
         self.profiles.append(new_prf)
+        self._prof_by_name[new_prf.profile_name] = new_prf
         if make_active:
             self.active_profile = new_prf.profile_name
 
@@ -372,6 +480,7 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         prf_names = self.profile_names
         if profile_name in prf_names:
             self.profiles = [x for x in self.profiles if x.profile_name != profile_name]
+            del self._prof_by_name[profile_name]
             prf_names = self.profile_names
             if self.using_profile not in prf_names:
                 self.using_profile = prf_names[0]
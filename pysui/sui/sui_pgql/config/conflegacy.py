@@ -61,13 +61,16 @@ class ConfigSui(dataclasses_json.DataClassJsonMixin):
 
 
 def address_and_alias_from_keystring(
-    indata: str, calias: list[ProfileAlias]
+    indata: str, calias: dict[str, ProfileAlias]
 ) -> tuple[str, ProfileAlias]:
-    """From a 44 char keypair string create an address string and return matched alias."""
+    """From a 44 char keypair string create an address string and return matched alias.
+
+    The aliases are keyed by their base64 public key.
+    """
     _kp = keypair_from_keystring(indata).to_bytes()
     digest = _kp[0:33] if _kp[0] == 0 else _kp[0:34]
     pubkey = base64.b64encode(digest).decode()
-    alias = next(filter(lambda pa: pa.public_key_base64 == pubkey, calias), False)
+    alias = calias.get(pubkey)
     if alias:
         addy = format(f"0x{hashlib.blake2b(digest, digest_size=32).hexdigest()}")
         return addy, alias
@@ -101,10 +104,10 @@ def load_client_yaml(client_file: Path, json_rpc_group: str) -> ProfileGroup:
             _prf.faucet_status_url = _TESTNET_FAUCET_STATUS_URL
         _prf_list.append(_prf)
 
-    _alias_cache = [
-        ProfileAlias.from_dict(x)
+    _alias_cache = {
+        x["public_key_base64"]: ProfileAlias.from_dict(x)
         for x in json.loads(_client_alias.read_text(encoding="utf8"))
-    ]
+    }
 
     _prf_keys: list[ProfileKey] = []
     _prf_addy: list[str] = []
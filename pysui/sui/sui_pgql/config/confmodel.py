@@ -6,6 +6,7 @@
 """Sui Configuration Model."""
 
 import dataclasses
+from copy import copy
 from typing import Optional, Union
 from pathlib import Path
 import dataclasses_json
@@ -34,11 +35,34 @@ class PysuiConfigModel(dataclasses_json.DataClassJsonMixin):
         default_factory=list
     )
 
+    def __post_init__(self):
+        """Build the group lookup index."""
+        self._groups_by_name: dict[str, prfgrp.ProfileGroup] = {
+            x.group_name: x for x in self.groups
+        }
+
+    @classmethod
+    def from_dict(cls, kvs: dict, *, infer_missing=False) -> "PysuiConfigModel":
+        """Create from dictionary."""
+        return cls(
+            kvs.get("version", ""),
+            kvs.get("sui_binary", ""),
+            kvs.get("group_active", ""),
+            [prfgrp.ProfileGroup.from_dict(x) for x in kvs.get("groups", [])],
+        )
+
+    def to_dict(self, encode_json=False) -> dict:
+        """Return as dictionary."""
+        return {
+            "version": self.version,
+            "sui_binary": self.sui_binary,
+            "group_active": self.group_active,
+            "groups": [x.to_dict() for x in self.groups],
+        }
+
     def _group_exists(self, *, group_name: str) -> Union[prfgrp.ProfileGroup, bool]:
         """Check if a group, by name, exists."""
-        return next(
-            filter(lambda grp: grp.group_name == group_name, self.groups), False
-        )
+        return self._groups_by_name.get(group_name, False)
 
     def has_group(self, *, group_name: str) -> bool:
         """Test for group existence."""
@@ -48,6 +72,7 @@ class PysuiConfigModel(dataclasses_json.DataClassJsonMixin):
         """Remove a group from the group list."""
         _target_group = self.get_group(group_name=group_name)
         self.groups.remove(_target_group)
+        del self._groups_by_name[group_name]
         # Adjust active group
         if self.group_active == _target_group.group_name:
             if self.groups:
@@ -99,6 +124,7 @@ class PysuiConfigModel(dataclasses_json.DataClassJsonMixin):
             if not self._group_exists(group_name=json_rpc_group_name):
                 sui_group = load_client_yaml(sui_config, json_rpc_group_name)
                 self.groups.append(sui_group)
+                self._groups_by_name[json_rpc_group_name] = sui_group
                 self.version = _CURRENT_CONFIG_VERSION
                 _updated = True
         return _updated
@@ -132,12 +158,14 @@ class PysuiConfigModel(dataclasses_json.DataClassJsonMixin):
                         gql_rpc_group_name,
                         _using_profile,
                         _suigrp.using_address,
-                        _suigrp.alias_list.copy(),
+                        # Aliases are renamed in place, each group holds its own
+                        [copy(x) for x in _suigrp.alias_list],
                         _suigrp.key_list.copy(),
                         _suigrp.address_list.copy(),
                         [prfgrp.Profile(k, v) for k, v in _GQL_DEFAULTS.items()],
                     )
                 )
+                self._groups_by_name[gql_rpc_group_name] = self.groups[-1]
             else:
                 _mnem, new_addy, prf_key, prf_alias = (
                     prfgrp.ProfileGroup.new_keypair_parts(
@@ -156,6 +184,7 @@ class PysuiConfigModel(dataclasses_json.DataClassJsonMixin):
                         [prfgrp.Profile(k, v) for k, v in _GQL_DEFAULTS.items()],
                     )
                 )
+                self._groups_by_name[gql_rpc_group_name] = self.groups[-1]
 
             _updated = True
         return _updated
@@ -184,11 +213,13 @@ class PysuiConfigModel(dataclasses_json.DataClassJsonMixin):
         _res = self._group_exists(group_name=group.group_name)
         if not _res:
             self.groups.append(group)
+            self._groups_by_name[group.group_name] = group
             self.group_active = group.group_name if make_active else self.group_active
             _updated = True
         elif overwrite:
             # Replace with new group
             self.groups[self.groups.index(_res)] = group
+            self._groups_by_name[group.group_name] = group
             self.group_active = group.group_name if make_active else self.group_active
             _updated = True
         return _updated
@@ -207,5 +238,6 @@ class PysuiConfigModel(dataclasses_json.DataClassJsonMixin):
                 else:
                     self.group_active = ""
             self.groups.pop(_gindex)
+            del self._groups_by_name[group_name]
             return
         raise ValueError(f"Group {group_name} not found.")
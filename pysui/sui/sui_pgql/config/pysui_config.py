@@ -13,6 +13,7 @@ from typing import Optional
 from pysui.abstracts.client_keypair import SignatureScheme
 from pysui.sui.sui_pgql.config.confmodel import PysuiConfigModel
 import pysui.sui.sui_pgql.config.confgroup as cfg_group
+from pysui.sui.sui_common.json_codec import json_loads
 
 
 class PysuiConfiguration:
@@ -60,8 +61,8 @@ class PysuiConfiguration:
             self._model: PysuiConfigModel = PysuiConfigModel()
             self._config_file.write_text(self._model.to_json(indent=2))
         else:
-            self._model: PysuiConfigModel = PysuiConfigModel.from_json(
-                self._config_file.read_text(encoding="utf8")
+            self._model: PysuiConfigModel = PysuiConfigModel.from_dict(
+                json_loads(self._config_file.read_bytes())
             )
         # Set up user group if not exist, don't overwrite
         self.model.add_group(
@@ -136,11 +136,7 @@ class AsyncCachingTransactionExecutor:
         use_as_gas = coin_list.pop(0)
         logger.debug(f"_smash_gas merging coins to version {use_as_gas.version}")
         await tx.merge_coins(merge_to=tx.gas, merge_from=coin_list)
-        res = await self._client.execute_query_node(
-            with_node=qn.ExecuteTransaction(
-                **await tx.build_and_sign(use_gas_objects=[use_as_gas])
-            )
-        )
+        res = await tx.execute(use_gas_objects=[use_as_gas])
         if res.is_err():
             raise ValueError(f"Failed smashing coins with {res.result_string}")
 
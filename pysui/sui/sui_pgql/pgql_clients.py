@@ -9,6 +9,8 @@
 from abc import ABC, abstractmethod
 import logging
 import asyncio
+from collections import OrderedDict
+from copy import copy, deepcopy
 from time import sleep
 from typing import Callable, Any, Optional, Union
 from deprecated.sphinx import versionchanged, versionadded
@@ -19,6 +21,14 @@ from gql.dsl import (
     DSLSchema,
 )
 from graphql import DocumentNode, print_ast
+from graphql.language.ast import (
+    FieldNode,
+    FragmentDefinitionNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+)
 from graphql.error.syntax_error import GraphQLSyntaxError
 from graphql.utilities.print_schema import print_schema
 from graphql.language.printer import print_ast
@@ -38,6 +48,11 @@ logger = logging.getLogger("pgql_client")
 class PGQL_QueryNode(ABC):
     """Base query class."""
 
+    # True if results for the same arguments never change (e.g. by version or digest)
+    IS_STABLE: bool = False
+    # True if the QueryNode only reads, concurrent identical executions may share it
+    IS_READ_ONLY: bool = False
+
     @abstractmethod
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """Returns a gql DocumentNode ready to execute.
@@ -59,6 +74,17 @@ class PGQL_QueryNode(ABC):
         """
         return None
 
+    def is_static(self) -> bool:
+        """Return True if the QueryNode holds no arguments.
+
+        A static QueryNode produces the same DocumentNode for a given schema, which
+        is then built and printed once and reused on subsequent executions.
+
+        :return: True if all instance attributes are None
+        :rtype: bool
+        """
+        return all(x is None for x in vars(self).values())
+
 
 class PGQL_NoOp(PGQL_QueryNode):
     """Noop query class."""
@@ -72,7 +98,17 @@ class PGQL_NoOp(PGQL_QueryNode):
 
 
 class PGQL_Fragment(ABC):
-    """Base Fragment class."""
+    """Base Fragment class.
+
+    Fragments are stateless, instances of the same class compare equal so that
+    a cached `fragment` is built once per schema rather than once per instance.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
 
 
 @versionchanged(
@@ -82,6 +118,9 @@ class PGQL_Fragment(ABC):
 class BaseSuiGQLClient:
     """Base GraphQL client."""
 
+    # Maximum number of stable QueryNode responses retained
+    RESPONSE_CACHE_SIZE: int = 256
+
     def __init__(
         self,
         *,
@@ -95,6 +134,7 @@ class BaseSuiGQLClient:
         self._pysui_config: PysuiConfiguration = pysui_config
         self._schema: scm.Schema = schema
         self._default_header = default_header if default_header else {}
+        self._response_cache: OrderedDict[tuple, dict] = OrderedDict()
         # Schema persist
         if write_schema:
             def_env = self._schema.rpc_config.gqlEnvironment
@@ -167,11 +207,17 @@ class BaseSuiGQLClient:
             )
             setattr(qnode, "owner", resolved_owner)
 
+    def _qnode_document(self, qnode: PGQL_QueryNode) -> DocumentNode:
+        """Return the QueryNode's DocumentNode, reusing the schema's for static nodes."""
+        if qnode.is_static():
+            return self._schema.static_document(qnode)
+        return qnode.as_document_node(self.schema())
+
     def _qnode_pre_run(self, qnode: PGQL_QueryNode) -> Union[DocumentNode, ValueError]:
         """."""
         if issubclass(type(qnode), PGQL_QueryNode):
             self._qnode_owner(qnode)
-            dnode = qnode.as_document_node(self.schema())
+            dnode = self._qnode_document(qnode)
             if isinstance(dnode, DocumentNode):
                 return dnode
             else:
@@ -179,11 +225,154 @@ class BaseSuiGQLClient:
         else:
             raise ValueError("Not a valid PGQL_QueryNode")
 
+    @staticmethod
+    def _qnode_key(qnode: PGQL_QueryNode) -> Union[tuple, None]:
+        """Return a key of QueryNode class and arguments, None if not hashable."""
+        qkey = (type(qnode), tuple(vars(qnode).items()))
+        try:
+            hash(qkey)
+        except TypeError:
+            return None
+        return qkey
+
+    def _response_cache_key(
+        self, qnode: PGQL_QueryNode, with_headers: Optional[dict]
+    ) -> Union[tuple, None]:
+        """Return the response cache key for stable QueryNodes, else None."""
+        if not qnode.IS_STABLE or with_headers:
+            return None
+        return self._qnode_key(qnode)
+
+    def _response_cache_get(self, ckey: tuple) -> Union[dict, None]:
+        """Return a copy of a cached raw response, or None."""
+        sres = self._response_cache.get(ckey)
+        if sres is None:
+            return None
+        self._response_cache.move_to_end(ckey)
+        return deepcopy(sres)
+
+    def _response_cache_fn(
+        self, ckey: tuple, encode_fn: Optional[Callable[[dict], Any]]
+    ) -> Callable[[dict], Any]:
+        """Wrap encode_fn to retain the raw response before encoding."""
+
+        def _cache_and_encode(sres: dict) -> Any:
+            # A missing (null) result may exist later so it is not retained
+            raw = deepcopy(sres) if all(x is not None for x in sres.values()) else None
+            result = encode_fn(sres) if encode_fn else sres
+            if raw:
+                self._response_cache[ckey] = raw
+                if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+            return result
+
+        return _cache_and_encode
+
     @versionadded(version="0.60.0", reason="Support query inspection")
     def query_node_to_string(self, *, query_node: PGQL_QueryNode) -> str:
         """."""
         self._qnode_owner(query_node)
-        return print_ast(query_node.as_document_node(self.schema()))
+        return print_ast(self._qnode_document(query_node))
+
+    @staticmethod
+    def _batch_alias(index: int, name: str) -> str:
+        """Return the batch alias for a QueryNode's root field."""
+        return f"q{index}_{name}"
+
+    def _qnodes_pre_run(
+        self, qnodes: list[PGQL_QueryNode]
+    ) -> tuple[Union[DocumentNode, None], list[tuple[Union[list[str], None], Any]]]:
+        """Merge the QueryNodes into a single aliased query DocumentNode.
+
+        Each QueryNode's root fields are aliased with a `q<index>_` prefix and
+        fragments are de-duplicated by name. Returns the merged DocumentNode, or None if
+        all nodes resolved to no-op, along with a plan used to split the response.
+        """
+        fragments: dict[str, FragmentDefinitionNode] = {}
+        selections: list[FieldNode] = []
+        qplan: list[tuple[Union[list[str], None], Any]] = []
+        for index, qnode in enumerate(qnodes):
+            if not issubclass(type(qnode), PGQL_QueryNode):
+                raise ValueError("Not a valid PGQL_QueryNode")
+            self._qnode_owner(qnode)
+            dnode = self._qnode_document(qnode)
+            if dnode is PGQL_NoOp:
+                qplan.append((None, None))
+                continue
+            if not isinstance(dnode, DocumentNode):
+                raise ValueError("QueryNode did not produce a gql DocumentNode")
+            root_names: list[str] = []
+            for definition in dnode.definitions:
+                if isinstance(definition, FragmentDefinitionNode):
+                    fragments.setdefault(definition.name.value, definition)
+                elif (
+                    isinstance(definition, OperationDefinitionNode)
+                    and definition.operation == OperationType.QUERY
+                    and not definition.variable_definitions
+                ):
+                    for field in definition.selection_set.selections:
+                        if not isinstance(field, FieldNode):
+                            raise ValueError("Batched QueryNode root must be fields")
+                        root_name = (field.alias or field.name).value
+                        bfield = copy(field)
+                        bfield.alias = NameNode(
+                            value=self._batch_alias(index, root_name)
+                        )
+                        selections.append(bfield)
+                        root_names.append(root_name)
+                else:
+                    raise ValueError(
+                        f"{qnode.__class__.__name__} can not be batched, only queries without variables"
+                    )
+            qplan.append((root_names, qnode.encode_fn()))
+        if not selections:
+            return None, qplan
+        return (
+            DocumentNode(
+                definitions=(
+                    OperationDefinitionNode(
+                        operation=OperationType.QUERY,
+                        directives=(),
+                        variable_definitions=(),
+                        selection_set=SelectionSetNode(selections=tuple(selections)),
+                    ),
+                    *fragments.values(),
+                )
+            ),
+            qplan,
+        )
+
+    def _qnodes_post_run(
+        self,
+        result: Union[SuiRpcResult, None],
+        qplan: list[tuple[Union[list[str], None], Any]],
+    ) -> list[SuiRpcResult]:
+        """Split a batched query result into a result per QueryNode."""
+        results: list[SuiRpcResult] = []
+        for index, (root_names, encode_fn) in enumerate(qplan):
+            if root_names is None:
+                results.append(SuiRpcResult(True, None, pgql_type.NoopGQL.from_query()))
+            elif result.is_err():
+                # Each QueryNode gets it's own result to change
+                results.append(deepcopy(result))
+            else:
+                sres = {
+                    x: result.result_data[self._batch_alias(index, x)]
+                    for x in root_names
+                }
+                try:
+                    results.append(
+                        SuiRpcResult(True, None, encode_fn(sres) if encode_fn else sres)
+                    )
+                except (TypeError, ValueError, KeyError) as exc:
+                    results.append(
+                        SuiRpcResult(
+                            False,
+                            exc.__class__.__name__,
+                            pgql_type.ErrorGQL.from_query(exc.args),
+                        )
+                    )
+        return results
 
 
 class SuiGQLClient(BaseSuiGQLClient):
@@ -210,6 +399,11 @@ class SuiGQLClient(BaseSuiGQLClient):
             default_header=default_header,
         )
 
+    @versionadded(version="0.77.0", reason="Persistent session for sync client")
+    def close(self) -> None:
+        """Close the connection."""
+        self._schema.client.close_sync()
+
     @versionadded(
         version="0.56.0", reason="Common node execution with exception handling"
     )
@@ -231,7 +425,7 @@ class SuiGQLClient(BaseSuiGQLClient):
         :rtype: SuiRpcResult
         """
         try:
-            sres = self.client().execute(
+            sres = self._schema.sync_session.execute(
                 node, extra_args=with_headers or self._default_header
             )
             return SuiRpcResult(True, None, sres if not encode_fn else encode_fn(sres))
@@ -337,16 +531,67 @@ class SuiGQLClient(BaseSuiGQLClient):
         :rtype: SuiRpcResult
         """
         try:
+            encode_fn = encode_fn or with_node.encode_fn()
+            ckey = self._response_cache_key(with_node, with_headers)
+            if ckey:
+                sres = self._response_cache_get(ckey)
+                if sres is not None:
+                    return SuiRpcResult(
+                        True, None, encode_fn(sres) if encode_fn else sres
+                    )
+                encode_fn = self._response_cache_fn(ckey, encode_fn)
             qdoc_node = self._qnode_pre_run(with_node)
             if isinstance(qdoc_node, PGQL_NoOp):
                 return SuiRpcResult(True, None, pgql_type.NoopGQL.from_query())
-            encode_fn = encode_fn or with_node.encode_fn()
             return self._execute(qdoc_node, with_headers, encode_fn)
         except ValueError as ve:
             return SuiRpcResult(
                 False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
             )
 
+    @versionadded(
+        version="0.77.0", reason="Batch independent QueryNodes in one request"
+    )
+    def execute_query_nodes(
+        self,
+        *,
+        with_nodes: list[PGQL_QueryNode],
+        with_headers: Optional[dict] = None,
+        batch: Optional[bool] = True,
+    ) -> list[SuiRpcResult]:
+        """execute_query_nodes Execute multiple independent pysui GraphQL QueryNodes.
+
+        When batching, the QueryNodes are merged into one aliased GraphQL query and
+        executed in a single round trip. Each QueryNode's encoding function is applied
+        to it's portion of the result.
+
+        :param with_nodes: The QueryNodes for execution
+        :type with_nodes: list[PGQL_QueryNode]
+        :param with_headers: Add extra arguments for http client headers, default to None
+        :type with_headers: Optional[dict]
+        :param batch: Merge into a single request, defaults to True. If False, each
+            QueryNode is executed in turn
+        :type batch: Optional[bool], optional
+        :return: A SuiRpcResult for each QueryNode, in order
+        :rtype: list[SuiRpcResult]
+        """
+        if not batch:
+            return [
+                self.execute_query_node(with_node=x, with_headers=with_headers)
+                for x in with_nodes
+            ]
+        try:
+            qdoc_node, qplan = self._qnodes_pre_run(with_nodes)
+        except ValueError as ve:
+            return [
+                SuiRpcResult(
+                    False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
+                )
+                for _ in with_nodes
+            ]
+        result = self._execute(qdoc_node, with_headers) if qdoc_node else None
+        return self._qnodes_post_run(result, qplan)
+
     @versionadded(version="0.75.0", reason="Execution of transaction changes.")
     def wait_for_transaction(
         self, *, digest: str, timeout: int = 60, poll_interval: int = 2
@@ -405,6 +650,7 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
             default_header=default_header,
         )
         self._slock = asyncio.Semaphore()
+        self._inflight: dict[tuple, asyncio.Future] = {}
 
     @property
     def session(self) -> Any:
@@ -437,15 +683,14 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
         :rtype: SuiRpcResult
         """
         try:
+            # Guard session creation only, executions may run concurrently
             async with self._slock:
                 _session = await self.async_client()
-                sres = await _session.execute(
-                    node, extra_args=with_headers or self._default_header
-                )
+            sres = await _session.execute(
+                node, extra_args=with_headers or self._default_header
+            )
 
-                return SuiRpcResult(
-                    True, None, sres if not encode_fn else encode_fn(sres)
-                )
+            return SuiRpcResult(True, None, sres if not encode_fn else encode_fn(sres))
 
         except texc.TransportQueryError as gte:
             return SuiRpcResult(
@@ -537,6 +782,10 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
     ) -> SuiRpcResult:
         """execute_query_node Execute a pysui GraphQL QueryNode.
 
+        Concurrent executions of an identical read only QueryNode (`IS_READ_ONLY` or
+        `IS_STABLE`) share a single request. Callers joining the request receive a
+        copy of the result.
+
         :param with_node: The QueryNode for execution
         :type with_node: PGQL_QueryNode
         :param with_headers: Add extra arguments for http client headers, default to None
@@ -546,11 +795,66 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
         :return: SuiRpcResult cointaining status and raw result (dict) or that defined by serialization function
         :rtype: SuiRpcResult
         """
+        # Identical read only QueryNodes already executing share the pending result
+        ikey = None
+        if (with_node.IS_READ_ONLY or with_node.IS_STABLE) and not with_headers:
+            ikey = self._qnode_key(with_node)
+        if ikey is None:
+            return await self._execute_query_node(with_node, with_headers, encode_fn)
+        ikey = (ikey, encode_fn)
+        inflight = self._inflight.get(ikey)
+        if inflight is not None:
+            # Callers joining a pending request get their own result to change
+            return await self._inflight_copy(inflight)
+        inflight = asyncio.ensure_future(
+            self._execute_query_node(with_node, with_headers, encode_fn)
+        )
+        self._inflight[ikey] = inflight
+        inflight.add_done_callback(lambda _: self._inflight.pop(ikey, None))
+        return await asyncio.shield(inflight)
+
+    @staticmethod
+    def _inflight_copy(inflight: asyncio.Future) -> asyncio.Future:
+        """Return a future of a copy of the pending request's result.
+
+        The copy is taken in a done callback of the request, which runs before the
+        originating caller resumes and can change the result.
+        """
+        copied = asyncio.get_running_loop().create_future()
+
+        def _copy_result(done: asyncio.Future) -> None:
+            if copied.done():
+                return
+            if done.cancelled():
+                copied.cancel()
+            elif done.exception() is not None:
+                copied.set_exception(done.exception())
+            else:
+                copied.set_result(deepcopy(done.result()))
+
+        inflight.add_done_callback(_copy_result)
+        return copied
+
+    async def _execute_query_node(
+        self,
+        with_node: PGQL_QueryNode,
+        with_headers: Optional[dict] = None,
+        encode_fn: Optional[Callable[[dict], Any]] = None,
+    ) -> SuiRpcResult:
+        """Execute a pysui GraphQL QueryNode."""
         try:
+            encode_fn = encode_fn or with_node.encode_fn()
+            ckey = self._response_cache_key(with_node, with_headers)
+            if ckey:
+                sres = self._response_cache_get(ckey)
+                if sres is not None:
+                    return SuiRpcResult(
+                        True, None, encode_fn(sres) if encode_fn else sres
+                    )
+                encode_fn = self._response_cache_fn(ckey, encode_fn)
             qdoc_node = self._qnode_pre_run(with_node)
             if isinstance(qdoc_node, PGQL_NoOp):
                 return SuiRpcResult(True, None, pgql_type.NoopGQL.from_query())
-            encode_fn = encode_fn or with_node.encode_fn()
             return await self._execute(qdoc_node, with_headers, encode_fn)
 
         except ValueError as ve:
@@ -558,6 +862,49 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
                 False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
             )
 
+    @versionadded(
+        version="0.77.0", reason="Batch independent QueryNodes in one request"
+    )
+    async def execute_query_nodes(
+        self,
+        *,
+        with_nodes: list[PGQL_QueryNode],
+        with_headers: Optional[dict] = None,
+        batch: Optional[bool] = True,
+    ) -> list[SuiRpcResult]:
+        """execute_query_nodes Execute multiple independent pysui GraphQL QueryNodes.
+
+        When batching, the QueryNodes are merged into one aliased GraphQL query and
+        executed in a single round trip. Each QueryNode's encoding function is applied
+        to it's portion of the result.
+
+        :param with_nodes: The QueryNodes for execution
+        :type with_nodes: list[PGQL_QueryNode]
+        :param with_headers: Add extra arguments for http client headers, default to None
+        :type with_headers: Optional[dict]
+        :param batch: Merge into a single request, defaults to True. If False, each
+            QueryNode is executed in turn
+        :type batch: Optional[bool], optional
+        :return: A SuiRpcResult for each QueryNode, in order
+        :rtype: list[SuiRpcResult]
+        """
+        if not batch:
+            return [
+                await self.execute_query_node(with_node=x, with_headers=with_headers)
+                for x in with_nodes
+            ]
+        try:
+            qdoc_node, qplan = self._qnodes_pre_run(with_nodes)
+        except ValueError as ve:
+            return [
+                SuiRpcResult(
+                    False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
+                )
+                for _ in with_nodes
+            ]
+        result = await self._execute(qdoc_node, with_headers) if qdoc_node else None
+        return self._qnodes_post_run(result, qplan)
+
     @versionadded(version="0.73.0", reason="Execution of transaction changes.")
     async def wait_for_transaction(
         self, *, digest: str, timeout: int = 60, poll_interval: int = 2
@@ -826,7 +826,6 @@ class Validator(PGQL_Fragment):
 class ValidatorSet(PGQL_Fragment):
     """ValidatorSet reusable fragment."""
 
-    @cache
     def fragment(self, schema: DSLSchema, active_vals: DSLField) -> DSLFragment:
         """."""
         pg_cursor = PageCursor()
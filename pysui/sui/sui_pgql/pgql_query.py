@@ -27,6 +27,8 @@ from pysui.sui.sui_pgql.pgql_validators import TypeValidator
 class GetCoinMetaData(PGQL_QueryNode):
     """GetCoinMetaData returns meta data for a specific `coin_type`."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, coin_type: Optional[str] = "0x2::sui::SUI") -> None:
         """QueryNode initializer.
 
@@ -61,6 +63,8 @@ class GetAllCoinBalances(PGQL_QueryNode):
     You take the coin_type from any list member and call...
     """
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self, *, owner: str, next_page: Optional[pgql_type.PagingCursor] = None
     ):
@@ -107,6 +111,8 @@ class GetAllCoinBalances(PGQL_QueryNode):
 class GetCoinSummary(PGQL_QueryNode):
     """GetCoinSummary Returns balance,digest and version"""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, owner: str, coin_id: str):
         """Set up."""
         self.owner = owner
@@ -145,12 +151,15 @@ class GetCoinSummary(PGQL_QueryNode):
 class GetCoins(PGQL_QueryNode):
     """GetCoins Returns all Coin objects of a specific type for owner."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self,
         *,
         owner: str,
         coin_type: Optional[str] = "0x2::sui::SUI",
         next_page: Optional[pgql_type.PagingCursor] = None,
+        page_size: Optional[int] = None,
     ):
         """QueryNode initializer.
 
@@ -160,10 +169,13 @@ class GetCoins(PGQL_QueryNode):
         :type coin_type: str, optional
         :param next_page: pgql_type.PagingCursor to advance query, defaults to None
         :type next_page: pgql_type.PagingCursor
+        :param page_size: Number of coins per page, defaults to None (service default)
+        :type page_size: int, optional
         """
         self.owner = owner
         self.coin_type = coin_type
         self.next_page = next_page
+        self.page_size = page_size
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """Build DocumentNode."""
@@ -174,6 +186,8 @@ class GetCoins(PGQL_QueryNode):
         coin_connection = schema.Address.coins(type=self.coin_type).alias("coins")
         if self.next_page:
             coin_connection(after=self.next_page.endCursor)
+        if self.page_size:
+            coin_connection(first=self.page_size)
 
         std_coin = frag.StandardCoin()
         pg_cursor = frag.PageCursor()
@@ -189,9 +203,72 @@ class GetCoins(PGQL_QueryNode):
         return pgql_type.SuiCoinObjectsGQL.from_query
 
 
+@versionadded(version="0.77.0", reason="Coin selection needing only references")
+class GetCoinSummaries(PGQL_QueryNode):
+    """GetCoinSummaries Returns id, digest, version and balance of owner's coins."""
+
+    IS_READ_ONLY: bool = True
+
+    def __init__(
+        self,
+        *,
+        owner: str,
+        coin_type: Optional[str] = "0x2::sui::SUI",
+        next_page: Optional[pgql_type.PagingCursor] = None,
+        page_size: Optional[int] = None,
+    ):
+        """QueryNode initializer.
+
+        :param owner: Owner's Sui address
+        :type owner: str
+        :param coin_type: The coin type to use in filtering, defaults to "0x2::sui::SUI"
+        :type coin_type: str, optional
+        :param next_page: pgql_type.PagingCursor to advance query, defaults to None
+        :type next_page: pgql_type.PagingCursor
+        :param page_size: Number of coins per page, defaults to None (service default)
+        :type page_size: int, optional
+        """
+        self.owner = owner
+        self.coin_type = coin_type
+        self.next_page = next_page
+        self.page_size = page_size
+
+    def as_document_node(self, schema: DSLSchema) -> DocumentNode:
+        """Build DocumentNode."""
+        if self.next_page and not self.next_page.hasNextPage:
+            return PGQL_NoOp
+
+        qres = schema.Query.address(address=self.owner).alias("qres")
+        coin_connection = schema.Address.coins(type=self.coin_type).alias("coins")
+        if self.next_page:
+            coin_connection(after=self.next_page.endCursor)
+        if self.page_size:
+            coin_connection(first=self.page_size)
+
+        pg_cursor = frag.PageCursor()
+        coin_connection.select(
+            cursor=schema.CoinConnection.pageInfo.select(pg_cursor.fragment(schema)),
+            coin_objects=schema.CoinConnection.nodes.select(
+                schema.Coin.version,
+                object_digest=schema.Coin.digest,
+                balance=schema.Coin.coinBalance,
+                coin_object_id=schema.Coin.address,
+            ),
+        )
+        qres.select(coin_connection)
+        return dsl_gql(pg_cursor.fragment(schema), DSLQuery(qres))
+
+    @staticmethod
+    def encode_fn() -> Callable[[dict], pgql_type.SuiCoinObjectSummariesGQL]:
+        """Return the serializer to SuiCoinObjectSummariesGQL function."""
+        return pgql_type.SuiCoinObjectSummariesGQL.from_query
+
+
 class GetLatestSuiSystemState(PGQL_QueryNode):
     """GetLatestSuiSystemState return the latest known SUI system state."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self) -> None:
         """QueryNode initializer."""
 
@@ -267,6 +344,8 @@ class GetLatestSuiSystemState(PGQL_QueryNode):
 class GetObject(PGQL_QueryNode):
     """Returns a specific object's data."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, object_id: str):
         """QueryNode initializer.
 
@@ -298,6 +377,8 @@ class GetObject(PGQL_QueryNode):
 class GetObjectsOwnedByAddress(PGQL_QueryNode):
     """Returns data for all objects by owner."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self, *, owner: str, next_page: Optional[pgql_type.PagingCursor] = None
     ):
@@ -344,6 +425,8 @@ class GetObjectsOwnedByAddress(PGQL_QueryNode):
 class GetMultipleGasObjects(PGQL_QueryNode):
     """Return basic Sui gas represnetation for each coin_id string."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, coin_object_ids: list[str]):
         """QueryNode initializer.
 
@@ -398,6 +481,8 @@ class GetMultipleGasObjects(PGQL_QueryNode):
 class GetMultipleObjects(PGQL_QueryNode):
     """Returns object data for list of object ids."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self,
         *,
@@ -447,6 +532,9 @@ class GetMultipleObjects(PGQL_QueryNode):
 class GetPastObject(PGQL_QueryNode):
     """Returns a specific objects version data."""
 
+    IS_STABLE: bool = True
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, object_id: str, version: int):
         """QueryNode initializer
 
@@ -493,6 +581,8 @@ class GetMultiplePastObjects(PGQL_QueryNode):
     policies.
     """
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, for_versions: list[dict]):
         """QueryNode initializer to fetch past object information for a list of object keys.
 
@@ -542,6 +632,8 @@ class GetMultipleVersionedObjects(PGQL_QueryNode):
     policies.
     """
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, for_versions: list[dict[str, int]]):
         """QueryNode initializer to fetch past object information for a list of object keys.
 
@@ -583,6 +675,8 @@ class GetMultipleVersionedObjects(PGQL_QueryNode):
 class GetDynamicFields(PGQL_QueryNode):
     """GetDynamicFields when executed, returns the list of dynamic field objects owned by an object."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self,
         *,
@@ -656,6 +750,8 @@ class GetDynamicFields(PGQL_QueryNode):
 class GetEvents(PGQL_QueryNode):
     """GetEvents When executed, return list of events for the filter choice."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self,
         *,
@@ -719,6 +815,8 @@ class GetEvents(PGQL_QueryNode):
 class GetTx(PGQL_QueryNode):
     """GetTx When executed, return the transaction response object."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, digest: str) -> None:
         """QueryNode initializer to fetch a transaction by digest id.
 
@@ -758,11 +856,17 @@ class GetTx(PGQL_QueryNode):
 class GetMultipleTx(PGQL_QueryNode):
     """GetTxs returns multiple transaction summaries and is controlled by filters and paging."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self, *, next_page: Optional[pgql_type.PagingCursor] = None, **qfilter
     ) -> None:
         """QueryNode initializer to fetch multiple transactions by filter parameters.
 
+        Paging uses the opaque keyset cursor returned by the prior page, the cost of
+        fetching a page does not grow with paging depth. To start at a known point, anchor
+        with a checkpoint filter (e.g. `afterCheckpoint=sequence_number`).
+
         :param next_page: Pagination curosr, defaults to None
         :type next_page: Optional[pgql_type.PagingCursor], optional
         :param qfilter: 0 or more TransactionBlockFilter key/value to apply to criteria
@@ -811,6 +915,8 @@ class GetMultipleTx(PGQL_QueryNode):
 class GetFilteredTx(PGQL_QueryNode):
     """GetTxs returns all transactions with TransactionBlockFilter set and is controlled by paging."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self, *, tx_filter: dict, next_page: Optional[pgql_type.PagingCursor] = None
     ) -> None:
@@ -866,6 +972,8 @@ class GetFilteredTx(PGQL_QueryNode):
 class GetTxKind(PGQL_QueryNode):
     """Gets details of Transaction kind."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, digest: str):
         """QueryNode initializer."""
         self.digest = digest
@@ -898,6 +1006,8 @@ class GetTxKind(PGQL_QueryNode):
 class GetDelegatedStakes(PGQL_QueryNode):
     """GetDelegatedStakes return all [StakedSui] coins for owner."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, owner: str, next_page: Optional[pgql_type.PagingCursor] = None):
         """QueryNode initializer.
 
@@ -977,6 +1087,8 @@ class GetDelegatedStakes(PGQL_QueryNode):
 class GetLatestCheckpointSequence(PGQL_QueryNode):
     """GetLatestCheckpointSequence return the sequence number of the latest checkpoint that has been executed."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self):
         """__init__ QueryNode initializer."""
 
@@ -999,6 +1111,9 @@ class GetLatestCheckpointSequence(PGQL_QueryNode):
 class GetCheckpointByDigest(PGQL_QueryNode):
     """GetCheckpointByDigest return a checkpoint for cp_id."""
 
+    IS_STABLE: bool = True
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, digest: str):
         """__init__ QueryNode initializer.
 
@@ -1026,6 +1141,9 @@ class GetCheckpointByDigest(PGQL_QueryNode):
 class GetCheckpointBySequence(PGQL_QueryNode):
     """GetCheckpoint return a checkpoint for cp_id."""
 
+    IS_STABLE: bool = True
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, sequence_number: int):
         """__init__ QueryNode initializer.
 
@@ -1053,6 +1171,8 @@ class GetCheckpointBySequence(PGQL_QueryNode):
 class GetCheckpoints(PGQL_QueryNode):
     """GetCheckpoints return paginated list of checkpoints."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, next_page: Optional[pgql_type.PagingCursor] = None):
         """QueryNode initializer."""
         self.next_page = next_page
@@ -1088,6 +1208,9 @@ class GetCheckpoints(PGQL_QueryNode):
 class GetProtocolConfig(PGQL_QueryNode):
     """Return the protocol config table for the given version number."""
 
+    IS_STABLE: bool = True
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, version: int):
         """QueryNode initializer
 
@@ -1112,6 +1235,8 @@ class GetProtocolConfig(PGQL_QueryNode):
 class GetReferenceGasPrice(PGQL_QueryNode):
     """GetReferenceGasPrice return the reference gas price for the network."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self):
         """QueryNode initializer."""
 
@@ -1131,6 +1256,8 @@ class GetReferenceGasPrice(PGQL_QueryNode):
 class GetNameServiceAddress(PGQL_QueryNode):
     """Return the resolved name service address for name."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, name: str):
         """__init__ QueryNode initializer."""
         self.name = name
@@ -1150,6 +1277,8 @@ class GetNameServiceAddress(PGQL_QueryNode):
 class GetNameServiceNames(PGQL_QueryNode):
     """Return the resolved names given address, if multiple names are resolved, the first one is the primary name."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self,
         *,
@@ -1177,6 +1306,8 @@ class GetNameServiceNames(PGQL_QueryNode):
 class GetValidatorsApy(PGQL_QueryNode):
     """Return the validator APY."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, next_page: Optional[pgql_type.PagingCursor] = None):
         """QueryNode initializer."""
         self.next_page = next_page
@@ -1223,6 +1354,8 @@ class GetValidatorsApy(PGQL_QueryNode):
 class GetCurrentValidators(PGQL_QueryNode):
     """Return the set of validators from the current Epoch."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, next_page: Optional[pgql_type.PagingCursor] = None):
         """QueryNode initializer."""
         self.next_page = next_page
@@ -1261,6 +1394,8 @@ class GetCurrentValidators(PGQL_QueryNode):
 class GetStructure(PGQL_QueryNode):
     """GetStructure When executed, returns a module's structure representation."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self,
         *,
@@ -1305,6 +1440,8 @@ class GetStructure(PGQL_QueryNode):
 class GetStructures(PGQL_QueryNode):
     """GetStructures When executed, returns all of a module's structures."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self,
         *,
@@ -1358,6 +1495,8 @@ class GetStructures(PGQL_QueryNode):
 class GetFunction(PGQL_QueryNode):
     """GetFunction When executed, returns a module's function information."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, package: str, module_name: str, function_name: str) -> None:
         """QueryNode initializer.
 
@@ -1394,6 +1533,8 @@ class GetFunction(PGQL_QueryNode):
 class GetFunctions(PGQL_QueryNode):
     """GetFunctions When executed, returns all module's functions information."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self,
         *,
@@ -1449,6 +1590,8 @@ class GetModule(PGQL_QueryNode):
     Includes general Module informationn as well as structure and function definitions.
     """
 
+    IS_READ_ONLY: bool = True
+
     def __init__(self, *, package: str, module_name: str) -> None:
         """__init__ Initialize GetModule object.
 
@@ -1489,6 +1632,8 @@ class GetModule(PGQL_QueryNode):
 class GetPackage(PGQL_QueryNode):
     """GetPackage When executed, return structured representations of the package."""
 
+    IS_READ_ONLY: bool = True
+
     def __init__(
         self, *, package: str, next_page: Optional[pgql_type.PagingCursor] = None
     ) -> None:
@@ -5,17 +5,112 @@
 
 """Schema management module."""
 
+import logging
+from typing import Any, Optional
 from gql import Client, gql
-from gql.client import ReconnectingAsyncClientSession
+from gql.client import ReconnectingAsyncClientSession, SyncClientSession
 import httpx
 
-from gql.transport.httpx import HTTPXTransport
+from gql.transport.httpx import HTTPXTransport, log as httpx_log
 from gql.transport.httpx import HTTPXAsyncTransport
 
 from gql.dsl import (
     DSLSchema,
 )
+from graphql import DocumentNode, ExecutionResult, print_ast
 from pysui.sui.sui_pgql.pgql_configs import pgql_config, SuiConfigGQL
+from pysui.sui.sui_common.json_codec import json_loads
+
+# Connection pool shared by requests on a client's transport
+_HTTPX_LIMITS: httpx.Limits = httpx.Limits(
+    max_connections=100, max_keepalive_connections=100
+)
+
+
+class _JsonResultMixin:
+    """Decode GraphQL responses from bytes, using orjson if installed.
+
+    Overrides the private HTTPXTransport method of the supported gql versions.
+    """
+
+    def _prepare_result(self, response: httpx.Response) -> ExecutionResult:
+        """Convert the http response to a GraphQL ExecutionResult."""
+        self.response_headers = response.headers
+        if httpx_log.isEnabledFor(logging.DEBUG):
+            httpx_log.debug("<<< %s", response.text)
+        try:
+            result: dict = json_loads(response.content)
+        except Exception:
+            self._raise_response_error(response, "Not a JSON answer")
+
+        if "errors" not in result and "data" not in result:
+            self._raise_response_error(response, 'No "data" or "errors" keys in answer')
+
+        return ExecutionResult(
+            errors=result.get("errors"),
+            data=result.get("data"),
+            extensions=result.get("extensions"),
+        )
+
+
+class _FrozenQueryMixin:
+    """Post the pre-printed query string of static documents.
+
+    Overrides the private HTTPXTransport method of the supported gql versions.
+    """
+
+    # Shared with the owning Schema, keyed by id of a retained DocumentNode
+    frozen_queries: dict[int, str] = {}
+
+    def _prepare_request(
+        self,
+        document: DocumentNode,
+        variable_values: Optional[dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        extra_args: Optional[dict[str, Any]] = None,
+        upload_files: bool = False,
+    ) -> dict[str, Any]:
+        """Prepare the http post arguments, skipping print for static documents."""
+        query_str = self.frozen_queries.get(id(document))
+        if query_str is None:
+            return super()._prepare_request(
+                document, variable_values, operation_name, extra_args, upload_files
+            )
+        payload: dict[str, Any] = {"query": query_str}
+        if httpx_log.isEnabledFor(logging.DEBUG):
+            httpx_log.debug(">>> %s", self.json_serialize(payload))
+        post_args: dict[str, Any] = {"json": payload}
+        if extra_args:
+            post_args.update(extra_args)
+        return post_args
+
+
+class _SuiHTTPXTransport(_FrozenQueryMixin, _JsonResultMixin, HTTPXTransport):
+    """Sync transport."""
+
+
+class _SuiHTTPXAsyncTransport(
+    _FrozenQueryMixin, _JsonResultMixin, HTTPXAsyncTransport
+):
+    """Async transport."""
+
+
+class _SuiSyncClient(Client):
+    """Sync client whose session stays connected across executions.
+
+    Executions, and ``with`` blocks, reuse the connected session. It is only
+    closed by ``close_sync`` and reconnects on next use.
+    """
+
+    def connect_sync(self) -> SyncClientSession:
+        """Return the connected session, connecting if needed."""
+        session: SyncClientSession = getattr(self, "session", None)
+        if session is not None and self.transport.client is not None:
+            return session
+        return super().connect_sync()
+
+    def __exit__(self, *args):
+        """Keep the session connected for reuse."""
 
 
 class Schema:
@@ -25,16 +120,23 @@ class Schema:
 
     def __init__(self, *, gql_url: str, gql_env: str):
         """."""
-        _init_client: Client = Client(
-            transport=HTTPXTransport(
-                url=gql_url,
-                verify=True,
-                http2=True,
-                timeout=120.0,
-            ),
+        self._static_documents: dict[type, DocumentNode] = {}
+        self._frozen_queries: dict[int, str] = {}
+        _transport = _SuiHTTPXTransport(
+            url=gql_url,
+            verify=True,
+            http2=True,
+            timeout=120.0,
+            limits=_HTTPX_LIMITS,
+        )
+        _transport.frozen_queries = self._frozen_queries
+        _init_client: Client = _SuiSyncClient(
+            transport=_transport,
             fetch_schema_from_transport=True,
         )
-        with _init_client as session:
+        # Session is kept open so connections are reused across executions
+        session: SyncClientSession = _init_client.connect_sync()
+        try:
             _long_version = session.transport.response_headers[
                 Schema.SCHEMA_HEADER_SCHEMA_KEY
             ]
@@ -43,14 +145,17 @@ class Schema:
             qstr, fndeser = pgql_config(gql_env, _base_version)
             _rpc_config: SuiConfigGQL = fndeser(session.execute(gql(qstr)))
             _rpc_config.gqlEnvironment = gql_env
-            self._base_version: str = _base_version
-            self._build_version: str = _long_version
-            self._rpc_config: SuiConfigGQL = _rpc_config
-            self._dsl_schema: DSLSchema = _schema
-            self._graph_url: str = gql_url
-            self._sync_client: Client = _init_client
-            self._async_client: Client = None
-            self._async_session: ReconnectingAsyncClientSession = None
+        except Exception:
+            _init_client.close_sync()
+            raise
+        self._base_version: str = _base_version
+        self._build_version: str = _long_version
+        self._rpc_config: SuiConfigGQL = _rpc_config
+        self._dsl_schema: DSLSchema = _schema
+        self._graph_url: str = gql_url
+        self._sync_client: Client = _init_client
+        self._async_client: Client = None
+        self._async_session: ReconnectingAsyncClientSession = None
 
     @property
     def base_version(self) -> str:
@@ -72,11 +177,34 @@ class Schema:
         """."""
         return self._dsl_schema
 
+    def static_document(self, qnode: Any) -> DocumentNode:
+        """Return the DocumentNode of a static QueryNode, built once per class.
+
+        The printed query string is retained alongside so transports post it as is.
+
+        :param qnode: A QueryNode holding no arguments
+        :type qnode: PGQL_QueryNode
+        :return: The QueryNode's DocumentNode for this schema
+        :rtype: DocumentNode
+        """
+        dnode = self._static_documents.get(type(qnode))
+        if dnode is None:
+            dnode = qnode.as_document_node(self._dsl_schema)
+            if isinstance(dnode, DocumentNode):
+                self._static_documents[type(qnode)] = dnode
+                self._frozen_queries[id(dnode)] = print_ast(dnode)
+        return dnode
+
     @property
     def client(self) -> Client:
         """."""
         return self._sync_client
 
+    @property
+    def sync_session(self) -> SyncClientSession:
+        """."""
+        return self._sync_client.connect_sync()
+
     @property
     async def async_session(self) -> ReconnectingAsyncClientSession:
         """."""
@@ -88,11 +216,14 @@ class Schema:
 
     def set_async_client(self):
         """."""
-        self._async_client = Client(
-            transport=HTTPXAsyncTransport(
-                url=self._graph_url,
-                verify=True,
-                http2=True,
-                timeout=120.0,
-            ),
+        # The sync session is only needed during initialization of async clients
+        self._sync_client.close_sync()
+        _transport = _SuiHTTPXAsyncTransport(
+            url=self._graph_url,
+            verify=True,
+            http2=True,
+            timeout=120.0,
+            limits=_HTTPX_LIMITS,
         )
+        _transport.frozen_queries = self._frozen_queries
+        self._async_client = Client(transport=_transport)
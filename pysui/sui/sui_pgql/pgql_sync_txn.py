@@ -11,6 +11,7 @@ from functools import cache
 from deprecated.sphinx import versionchanged, versionadded, deprecated
 from pysui.sui.sui_pgql.pgql_txn_base import _SuiTransactionBase as txbase
 
+from pysui import SuiRpcResult
 from pysui.sui.sui_types import bcs
 from pysui.sui.sui_txn.transaction_builder import PureInput
 import pysui.sui.sui_pgql.pgql_txb_gas as gd
@@ -196,6 +197,43 @@ class SuiTransaction(txbase):
         )
         return {self._BUILD_BYTE_STR: tx_bytes, self._SIG_ARRAY: sigs}
 
+    @versionadded(version="0.77.0", reason="Build, sign and execute the transaction")
+    def execute(
+        self,
+        *,
+        gas_budget: Optional[str] = None,
+        use_gas_objects: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]] = None,
+        txn_expires_after: Optional[int] = None,
+        with_headers: Optional[dict] = None,
+    ) -> SuiRpcResult:
+        """execute Build, sign and execute the transaction.
+
+        If executing fails, the dry run budget retained for the transaction is evicted.
+
+        :param gas_budget: Specify the amount of gas for the transaction budget, defaults to None
+        :type gas_budget: Optional[str], optional
+        :param use_gas_objects: Specify gas object(s) (by ID or SuiCoinObjectGQL), defaults to None
+        :type use_gas_objects: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]], optional
+        :param txn_expires_after: Specify the transaction expiration epoch ID, defaults to None
+        :type txn_expires_after: Optional[int],optional
+        :param with_headers: Add extra arguments for http client headers, default to None
+        :type with_headers: Optional[dict]
+        :return: The ExecuteTransaction result
+        :rtype: SuiRpcResult
+        """
+        return self._execution_result(
+            self.client.execute_query_node(
+                with_node=qn.ExecuteTransaction(
+                    **self.build_and_sign(
+                        gas_budget=gas_budget,
+                        use_gas_objects=use_gas_objects,
+                        txn_expires_after=txn_expires_after,
+                    )
+                ),
+                with_headers=with_headers,
+            )
+        )
+
     def split_coin(
         self,
         *,
@@ -3,42 +3,237 @@
 
 # -*- coding: utf-8 -*-
 
-import base64
+import binascii
+from collections import OrderedDict
+import hashlib
+import threading
 from typing import Optional, Union
 from pysui.sui.sui_pgql.pgql_txb_signing import SignerBlock
+from pysui import SuiRpcResult
 from pysui.sui.sui_pgql.pgql_clients import BaseSuiGQLClient
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 import pysui.sui.sui_pgql.pgql_query as qn
 from pysui.sui.sui_types import bcs
+from deprecated.sphinx import versionadded
 
+# Least computation units charged for any transaction
+MIN_GAS_UNITS: int = 1000
 
-def _get_gas_objects(
+# Maximum number of dry run budgets retained
+DRY_RUN_BUDGET_CACHE_SIZE: int = 512
+# Percentage added to a retained dry run budget when it is reused
+DRY_RUN_BUDGET_MARGIN: int = 15
+_dry_run_budgets: OrderedDict[tuple, int] = OrderedDict()
+_dry_run_budgets_lock: threading.Lock = threading.Lock()
+
+
+def _tx_kind_b64(tx_kind: bcs.TransactionKind) -> str:
+    """Return the base64 string of a serialized TransactionKind."""
+    return binascii.b2a_base64(tx_kind.serialize(), newline=False).decode()
+
+
+def _tx_kind_digest(tx_bytes: str) -> bytes:
+    """Return a short digest of the base64 TransactionKind."""
+    return hashlib.blake2b(tx_bytes.encode(), digest_size=16).digest()
+
+
+def _has_shared_inputs(tx_kind: bcs.TransactionKind) -> bool:
+    """Return True unless tx_kind is a programmable transaction of owned inputs."""
+    if tx_kind.enum_name != "ProgrammableTransaction":
+        return True
+    return any(
+        x.enum_name == "Object" and x.value.enum_name == "SharedObject"
+        for x in tx_kind.value.Inputs
+    )
+
+
+def _dry_run_budget_key(
+    sender: str,
+    sponsor: Optional[str],
+    client: BaseSuiGQLClient,
+    tx_kind: bcs.TransactionKind,
+    tx_bytes: str,
+    active_gas_price: int,
+) -> Union[tuple, None]:
+    """Return the key of a dry run budget, or None if it is not retained.
+
+    The cost of transactions with shared object inputs depends on the state of
+    those objects, their budgets are not retained.
+    """
+    if _has_shared_inputs(tx_kind):
+        return None
+    return (_tx_kind_digest(tx_bytes), client.url(), sender, sponsor, active_gas_price)
+
+
+def _cached_budget(bkey: Union[tuple, None]) -> Union[int, None]:
+    """Return a retained dry run budget with margin, or None."""
+    if bkey is None:
+        return None
+    with _dry_run_budgets_lock:
+        budget = _dry_run_budgets.get(bkey)
+        if budget is None:
+            return None
+        _dry_run_budgets.move_to_end(bkey)
+    return budget + budget * DRY_RUN_BUDGET_MARGIN // 100
+
+
+def _retain_budget(bkey: Union[tuple, None], budget: int) -> None:
+    """Retain a dry run budget."""
+    if bkey is None:
+        return
+    with _dry_run_budgets_lock:
+        _dry_run_budgets[bkey] = budget
+        if len(_dry_run_budgets) > DRY_RUN_BUDGET_CACHE_SIZE:
+            _dry_run_budgets.popitem(last=False)
+
+
+@versionadded(version="0.77.0", reason="Dry run budgets are retained")
+def evict_dry_run_budget(tx_kind: bcs.TransactionKind) -> None:
+    """Evict retained dry run budgets of a TransactionKind, e.g. after it failed.
+
+    `SuiTransaction.execute` calls this when executing the transaction fails.
+
+    :param tx_kind: The TransactionKind BCS
+    :type tx_kind: bcs.TransactionKind
+    """
+    digest = _tx_kind_digest(_tx_kind_b64(tx_kind))
+    with _dry_run_budgets_lock:
+        for bkey in [x for x in _dry_run_budgets if x[0] == digest]:
+            del _dry_run_budgets[bkey]
+
+
+def _gas_objects_nodes(
     client: BaseSuiGQLClient, gas_ids: list[str]
+) -> list[qn.GetMultipleGasObjects]:
+    """Return QueryNodes fetching gas_ids, each within a page of the service."""
+    chunk = client.rpc_config().serviceConfig.defaultPageSize
+    return [
+        qn.GetMultipleGasObjects(coin_object_ids=gas_ids[x : x + chunk])
+        for x in range(0, len(gas_ids), chunk)
+    ]
+
+
+def _gas_objects_result(
+    results: list[SuiRpcResult],
 ) -> list[pgql_type.SuiCoinObjectGQL]:
-    """Retreive specific Gas Objects."""
-    result = client.execute_query_node(
-        with_node=qn.GetMultipleGasObjects(coin_object_ids=gas_ids)
+    """Return the coins of GetMultipleGasObjects results."""
+    coins: list[pgql_type.SuiCoinObjectGQL] = []
+    for result in results:
+        if result.is_ok():
+            coins.extend(result.result_data.data)
+        else:
+            raise ValueError(f"Error retrieving coins by id {result.result_string}")
+    return coins
+
+
+def _dry_run_node(
+    sender: str, sponsor: Optional[str], tx_bytes: str, active_gas_price: int
+) -> qn.DryRunTransactionKind:
+    """Return the dry run QueryNode used to compute a budget.
+
+    The price is the one the transaction is built with, already known to the
+    caller, and is sent as is since computation cost is charged in its units.
+    """
+    return qn.DryRunTransactionKind(
+        tx_bytestr=tx_bytes,
+        tx_meta={
+            "sender": sender,
+            "gasPrice": active_gas_price,
+            "gasSponsor": sponsor,
+        },
+        skip_checks=False,
     )
+
+
+def _dry_run_result(result: SuiRpcResult) -> int:
+    """Return the budget from a DryRunTransactionKind result."""
     if result.is_ok():
-        return result.result_data.data
+        gas_summary: dict = result.result_data.transaction_block.effects[
+            "gasEffects"
+        ]["gasSummary"]
+        return int(gas_summary["computationCost"]) + int(gas_summary["storageCost"])
     else:
-        raise ValueError(f"Error retrieving coins by id {result.result_string}")
+        raise ValueError(
+            f"Error running DryRunTransactionBlock: {result.result_string}"
+        )
 
 
-def _get_all_gas_objects(
-    signing: SignerBlock, client: BaseSuiGQLClient
+def _get_gas_objects(
+    client: BaseSuiGQLClient, gas_ids: list[str]
 ) -> list[pgql_type.SuiCoinObjectGQL]:
-    """Retreive all Gas Objects."""
-    payer = signing.payer_address
-    coin_list: list[pgql_type.SuiCoinObjectGQL] = []
-    result = client.execute_query_node(with_node=qn.GetCoins(owner=payer))
+    """Retreive specific Gas Objects."""
+    return _gas_objects_result(
+        client.execute_query_nodes(with_nodes=_gas_objects_nodes(client, gas_ids))
+    )
+
+
+def _get_gas_objects_and_budget(
+    sender: str,
+    sponsor: Optional[str],
+    client: BaseSuiGQLClient,
+    gas_ids: list[str],
+    tx_bytes: str,
+    active_gas_price: int,
+) -> tuple[list[pgql_type.SuiCoinObjectGQL], int]:
+    """Retreive specific Gas Objects and dry run for budget in one request."""
+    *coins_results, dry_run_result = client.execute_query_nodes(
+        with_nodes=[
+            *_gas_objects_nodes(client, gas_ids),
+            _dry_run_node(sender, sponsor, tx_bytes, active_gas_price),
+        ]
+    )
+    return _gas_objects_result(coins_results), _dry_run_result(dry_run_result)
+
+
+def _check_minimum_gas(
+    coins: list[Union[pgql_type.SuiCoinObjectGQL, pgql_type.SuiCoinObjectSummaryGQL]],
+    active_gas_price: int,
+) -> None:
+    """Raise if coins can not pay for the least computation a transaction costs."""
+    minimum = MIN_GAS_UNITS * active_gas_price
+    total = sum(int(x.balance) for x in coins)
+    if total < minimum:
+        raise ValueError(
+            f"Total gas available {total}, transaction requires at least {minimum}"
+        )
+
+
+def _coin_page_size(client: BaseSuiGQLClient) -> int:
+    """Return the largest page size the service allows, fewest round trips."""
+    return client.rpc_config().serviceConfig.maxPageSize
+
+
+def _get_all_gas_objects(
+    payer: str,
+    client: BaseSuiGQLClient,
+    objects_in_use: set[str],
+    budget: int,
+    result: Optional[SuiRpcResult] = None,
+) -> list[pgql_type.SuiCoinObjectSummaryGQL]:
+    """Retreive Gas Objects not in use, paging until their balance covers budget.
+
+    Paging continues from result when the first page was already fetched.
+    """
+    page_size = _coin_page_size(client)
+    coin_list: list[pgql_type.SuiCoinObjectSummaryGQL] = []
+    accum: int = 0
+    if result is None:
+        result = client.execute_query_node(
+            with_node=qn.GetCoinSummaries(owner=payer, page_size=page_size)
+        )
     while True:
         if result.is_ok():
-            coin_list.extend(result.result_data.data)
-            if result.result_data.next_cursor.hasNextPage:
+            for coin in result.result_data.data:
+                if coin.coin_object_id not in objects_in_use:
+                    coin_list.append(coin)
+                    accum += int(coin.balance)
+            # Remaining pages are not needed once the budget is covered
+            if accum < budget and result.result_data.next_cursor.hasNextPage:
                 result = client.execute_query_node(
-                    with_node=qn.GetCoins(
-                        owner=payer, next_page=result.result_data.next_cursor
+                    with_node=qn.GetCoinSummaries(
+                        owner=payer,
+                        next_page=result.result_data.next_cursor,
+                        page_size=page_size,
                     )
                 )
             else:
@@ -48,64 +243,62 @@ def _get_all_gas_objects(
     return coin_list
 
 
+def _get_first_coins_and_budget(
+    sender: str,
+    sponsor: Optional[str],
+    payer: str,
+    client: BaseSuiGQLClient,
+    tx_bytes: str,
+    active_gas_price: int,
+) -> tuple[SuiRpcResult, int]:
+    """Retreive the first page of Gas Objects and dry run for budget in one request."""
+    coins_result, dry_run_result = client.execute_query_nodes(
+        with_nodes=[
+            qn.GetCoinSummaries(owner=payer, page_size=_coin_page_size(client)),
+            _dry_run_node(sender, sponsor, tx_bytes, active_gas_price),
+        ]
+    )
+    return coins_result, _dry_run_result(dry_run_result)
+
+
 def _dry_run_for_budget(
-    signing: SignerBlock,
+    sender: str,
+    sponsor: Optional[str],
     client: BaseSuiGQLClient,
     tx_bytes: str,
     active_gas_price: int,
 ) -> int:
     """Perform a dry run when no budget specified."""
-    result = client.execute_query_node(
-        with_node=qn.DryRunTransactionKind(
-            tx_bytestr=tx_bytes,
-            tx_meta={
-                "sender": signing.sender_str,
-                "gasPrice": active_gas_price,
-                "gasSponsor": signing.sponsor_str,
-            },
-            skip_checks=False,
+    return _dry_run_result(
+        client.execute_query_node(
+            with_node=_dry_run_node(sender, sponsor, tx_bytes, active_gas_price)
         )
     )
-    if result.is_ok():
-        c_cost: int = int(
-            result.result_data.transaction_block.effects["gasEffects"]["gasSummary"][
-                "computationCost"
-            ]
-        )
-        s_cost: int = int(
-            result.result_data.transaction_block.effects["gasEffects"]["gasSummary"][
-                "storageCost"
-            ]
-        )
-        return c_cost + s_cost
-    else:
-        raise ValueError(
-            f"Error running DryRunTransactionBlock: {result.result_string}"
-        )
 
 
 def _coins_for_budget(
-    coins: list[pgql_type.SuiCoinObjectGQL], budget: int
+    coins: list[Union[pgql_type.SuiCoinObjectGQL, pgql_type.SuiCoinObjectSummaryGQL]],
+    budget: int,
+    largest_first: bool,
 ) -> list[bcs.ObjectReference]:
-    """."""
-    _coin_fit = [x for x in coins if int(x.balance) > budget]
-    if _coin_fit:
-        _coin_fit = [_coin_fit[0]]
-    else:
-        _accum: int = 0
-        _accum_coin: list = []
-        for _coin in coins:
-            if _accum >= budget:
-                break
-            else:
-                _accum_coin.append(_coin)
-                _accum += int(_coin.balance)
-        if _accum < budget:
-            raise ValueError(
-                f"Total gas available {_accum}, transaction requires {budget}"
-            )
-        _coin_fit = _accum_coin
-    return [bcs.ObjectReference.from_gql_ref(x) for x in _coin_fit]
+    """Select coins covering budget, in order or the fewest with largest first.
+
+    The first coin selected is the transaction's primary gas coin, so coins the
+    caller specified are taken in the order given.
+    """
+    _accum: int = 0
+    _accum_coin: list = []
+    _coins = ((int(x.balance), x) for x in coins)
+    if largest_first:
+        _coins = sorted(_coins, key=lambda x: x[0], reverse=True)
+    for _balance, _coin in _coins:
+        _accum_coin.append(_coin)
+        _accum += _balance
+        if _accum >= budget:
+            break
+    if _accum < budget:
+        raise ValueError(f"Total gas available {_accum}, transaction requires {budget}")
+    return bcs.ObjectReference.from_gql_refs(_accum_coin)
 
 
 def get_gas_data(
@@ -139,30 +332,81 @@ def get_gas_data(
     :return: _description_
     :rtype: bcs.GasData
     """
-    # Get available coins
+    sender = signing.sender_str
+    sponsor = signing.sponsor_str
+    payer = signing.payer_address
+    # Reuse the budget of a previous dry run of the same transaction
+    bkey: Optional[tuple] = None
+    if not budget:
+        tx_bytes = _tx_kind_b64(tx_kind)
+        bkey = _dry_run_budget_key(
+            sender, sponsor, client, tx_kind, tx_bytes, active_gas_price
+        )
+        budget = _cached_budget(bkey)
+    # Get caller specified coins
     _specified_coins = True if use_coins else False
     if use_coins:
-        if all(isinstance(x, str) for x in use_coins):
-            use_coins = _get_gas_objects(client, use_coins)
+        # Type of the first coin decides, the rest must match
+        if isinstance(use_coins[0], str):
+            if not all(type(x) is str for x in use_coins):
+                raise ValueError("use_gas_objects must use same type.")
+            # Drop repeated coin ids, keeping order
+            use_coins = list(dict.fromkeys(use_coins))
+            if budget:
+                use_coins = _get_gas_objects(client, use_coins)
+            else:
+                use_coins, budget = _get_gas_objects_and_budget(
+                    sender,
+                    sponsor,
+                    client,
+                    use_coins,
+                    tx_bytes,
+                    active_gas_price,
+                )
+                _retain_budget(bkey, budget)
         elif not all(isinstance(x, pgql_type.SuiCoinObjectGQL) for x in use_coins):
             raise ValueError("use_gas_objects must use same type.")
-    else:
-        use_coins = _get_all_gas_objects(signing, client)
+        else:
+            use_coins = list({x.coin_object_id: x for x in use_coins}.values())
+        # Remove conflicts with objects in use
+        use_coins = [x for x in use_coins if x.coin_object_id not in objects_in_use]
+        if not use_coins:
+            raise ValueError("No coin objects found to fund transaction.")
+    # Dry run for the budget
+    first_page: Optional[SuiRpcResult] = None
     if not budget:
-        budget = _dry_run_for_budget(
-            signing,
-            client,
-            base64.b64encode(tx_kind.serialize()).decode(),
-            active_gas_price,
+        if _specified_coins:
+            # Fail before the dry run if specified coins cannot pay the minimum
+            _check_minimum_gas(use_coins, active_gas_price)
+            budget = _dry_run_for_budget(
+                sender,
+                sponsor,
+                client,
+                tx_bytes,
+                active_gas_price,
+            )
+        else:
+            # The first page of coins does not depend on the budget
+            first_page, budget = _get_first_coins_and_budget(
+                sender,
+                sponsor,
+                payer,
+                client,
+                tx_bytes,
+                active_gas_price,
+            )
+        _retain_budget(bkey, budget)
+    # Get available coins, objects in use are removed while paging
+    if not _specified_coins:
+        use_coins = _get_all_gas_objects(
+            payer, client, objects_in_use, budget, first_page
         )
-    # Remove conflicts with objects in use
-    use_coins = [x for x in use_coins if x.coin_object_id not in objects_in_use]
     # Make sure something left to pay for
     if use_coins:
         # Return constructs for createing bcs.GasData
         return bcs.GasData(
-            _coins_for_budget(use_coins, budget),
-            bcs.Address.from_str(signing.payer_address),
+            _coins_for_budget(use_coins, budget, not _specified_coins),
+            bcs.Address.from_str(payer),
             active_gas_price,
             budget,
         )
@@ -173,29 +417,60 @@ async def _async_get_gas_objects(
     client: BaseSuiGQLClient, gas_ids: list[str]
 ) -> list[pgql_type.SuiCoinObjectGQL]:
     """Retreive specific Gas Objects."""
-    result = await client.execute_query_node(
-        with_node=qn.GetMultipleGasObjects(coin_object_ids=gas_ids)
+    return _gas_objects_result(
+        await client.execute_query_nodes(with_nodes=_gas_objects_nodes(client, gas_ids))
     )
-    if result.is_ok():
-        return result.result_data.data
-    else:
-        raise ValueError(f"Error retrieving coins by id {result.result_string}")
+
+
+async def _async_get_gas_objects_and_budget(
+    sender: str,
+    sponsor: Optional[str],
+    client: BaseSuiGQLClient,
+    gas_ids: list[str],
+    tx_bytes: str,
+    active_gas_price: int,
+) -> tuple[list[pgql_type.SuiCoinObjectGQL], int]:
+    """Retreive specific Gas Objects and dry run for budget in one request."""
+    *coins_results, dry_run_result = await client.execute_query_nodes(
+        with_nodes=[
+            *_gas_objects_nodes(client, gas_ids),
+            _dry_run_node(sender, sponsor, tx_bytes, active_gas_price),
+        ]
+    )
+    return _gas_objects_result(coins_results), _dry_run_result(dry_run_result)
 
 
 async def _async_get_all_gas_objects(
-    signing: SignerBlock, client: BaseSuiGQLClient
-) -> list[pgql_type.SuiCoinObjectGQL]:
-    """Retreive all Gas Objects."""
-    payer = signing.payer_address
-    coin_list: list[pgql_type.SuiCoinObjectGQL] = []
-    result = await client.execute_query_node(with_node=qn.GetCoins(owner=payer))
+    payer: str,
+    client: BaseSuiGQLClient,
+    objects_in_use: set[str],
+    budget: int,
+    result: Optional[SuiRpcResult] = None,
+) -> list[pgql_type.SuiCoinObjectSummaryGQL]:
+    """Retreive Gas Objects not in use, paging until their balance covers budget.
+
+    Paging continues from result when the first page was already fetched.
+    """
+    page_size = _coin_page_size(client)
+    coin_list: list[pgql_type.SuiCoinObjectSummaryGQL] = []
+    accum: int = 0
+    if result is None:
+        result = await client.execute_query_node(
+            with_node=qn.GetCoinSummaries(owner=payer, page_size=page_size)
+        )
     while True:
         if result.is_ok():
-            coin_list.extend(result.result_data.data)
-            if result.result_data.next_cursor.hasNextPage:
+            for coin in result.result_data.data:
+                if coin.coin_object_id not in objects_in_use:
+                    coin_list.append(coin)
+                    accum += int(coin.balance)
+            # Remaining pages are not needed once the budget is covered
+            if accum < budget and result.result_data.next_cursor.hasNextPage:
                 result = await client.execute_query_node(
-                    with_node=qn.GetCoins(
-                        owner=payer, next_page=result.result_data.next_cursor
+                    with_node=qn.GetCoinSummaries(
+                        owner=payer,
+                        next_page=result.result_data.next_cursor,
+                        page_size=page_size,
                     )
                 )
             else:
@@ -205,40 +480,37 @@ async def _async_get_all_gas_objects(
     return coin_list
 
 
+async def _async_get_first_coins_and_budget(
+    sender: str,
+    sponsor: Optional[str],
+    payer: str,
+    client: BaseSuiGQLClient,
+    tx_bytes: str,
+    active_gas_price: int,
+) -> tuple[SuiRpcResult, int]:
+    """Retreive the first page of Gas Objects and dry run for budget in one request."""
+    coins_result, dry_run_result = await client.execute_query_nodes(
+        with_nodes=[
+            qn.GetCoinSummaries(owner=payer, page_size=_coin_page_size(client)),
+            _dry_run_node(sender, sponsor, tx_bytes, active_gas_price),
+        ]
+    )
+    return coins_result, _dry_run_result(dry_run_result)
+
+
 async def _async_dry_run_for_budget(
-    signing: SignerBlock,
+    sender: str,
+    sponsor: Optional[str],
     client: BaseSuiGQLClient,
     tx_bytes: str,
     active_gas_price: int,
 ) -> int:
     """Perform a dry run when no budget specified."""
-    result = await client.execute_query_node(
-        with_node=qn.DryRunTransactionKind(
-            tx_bytestr=tx_bytes,
-            tx_meta={
-                "sender": signing.sender_str,
-                "gasPrice": active_gas_price,
-                "gasSponsor": signing.sponsor_str,
-            },
-            skip_checks=False,
+    return _dry_run_result(
+        await client.execute_query_node(
+            with_node=_dry_run_node(sender, sponsor, tx_bytes, active_gas_price)
         )
     )
-    if result.is_ok():
-        c_cost: int = int(
-            result.result_data.transaction_block.effects["gasEffects"]["gasSummary"][
-                "computationCost"
-            ]
-        )
-        s_cost: int = int(
-            result.result_data.transaction_block.effects["gasEffects"]["gasSummary"][
-                "storageCost"
-            ]
-        )
-        return c_cost + s_cost
-    else:
-        raise ValueError(
-            f"Error running DryRunTransactionBlock: {result.result_string}"
-        )
 
 
 async def async_get_gas_data(
@@ -272,11 +544,38 @@ async def async_get_gas_data(
     :return: _description_
     :rtype: bcs.GasData
     """
-    # Get available coins
+    sender = signing.sender_str
+    sponsor = signing.sponsor_str
+    payer = signing.payer_address
+    # Reuse the budget of a previous dry run of the same transaction
+    bkey: Optional[tuple] = None
+    if not budget:
+        tx_bytes = _tx_kind_b64(tx_kind)
+        bkey = _dry_run_budget_key(
+            sender, sponsor, client, tx_kind, tx_bytes, active_gas_price
+        )
+        budget = _cached_budget(bkey)
+    # Get caller specified coins
     _specified_coins = True if use_coins else False
     if use_coins:
-        if all(isinstance(x, str) for x in use_coins):
-            use_coins = await _async_get_gas_objects(client, use_coins)
+        # Type of the first coin decides, the rest must match
+        if isinstance(use_coins[0], str):
+            if not all(type(x) is str for x in use_coins):
+                raise ValueError("use_gas_objects must use same type.")
+            # Drop repeated coin ids, keeping order
+            use_coins = list(dict.fromkeys(use_coins))
+            if budget:
+                use_coins = await _async_get_gas_objects(client, use_coins)
+            else:
+                use_coins, budget = await _async_get_gas_objects_and_budget(
+                    sender,
+                    sponsor,
+                    client,
+                    use_coins,
+                    tx_bytes,
+                    active_gas_price,
+                )
+                _retain_budget(bkey, budget)
         elif not all(
             isinstance(
                 x, (pgql_type.SuiCoinObjectGQL, pgql_type.SuiCoinObjectSummaryGQL)
@@ -284,23 +583,47 @@ async def async_get_gas_data(
             for x in use_coins
         ):
             raise ValueError("use_gas_objects must use same type.")
-    else:
-        use_coins = await _async_get_all_gas_objects(signing, client)
+        else:
+            use_coins = list({x.coin_object_id: x for x in use_coins}.values())
+        # Remove conflicts with objects in use
+        use_coins = [x for x in use_coins if x.coin_object_id not in objects_in_use]
+        if not use_coins:
+            raise ValueError("No coin objects found to fund transaction.")
+    # Dry run for the budget
+    first_page: Optional[SuiRpcResult] = None
     if not budget:
-        budget = await _async_dry_run_for_budget(
-            signing,
-            client,
-            base64.b64encode(tx_kind.serialize()).decode(),
-            active_gas_price,
+        if _specified_coins:
+            # Fail before the dry run if specified coins cannot pay the minimum
+            _check_minimum_gas(use_coins, active_gas_price)
+            budget = await _async_dry_run_for_budget(
+                sender,
+                sponsor,
+                client,
+                tx_bytes,
+                active_gas_price,
+            )
+        else:
+            # The first page of coins does not depend on the budget
+            first_page, budget = await _async_get_first_coins_and_budget(
+                sender,
+                sponsor,
+                payer,
+                client,
+                tx_bytes,
+                active_gas_price,
+            )
+        _retain_budget(bkey, budget)
+    # Get available coins, objects in use are removed while paging
+    if not _specified_coins:
+        use_coins = await _async_get_all_gas_objects(
+            payer, client, objects_in_use, budget, first_page
         )
-    # Remove conflicts with objects in use
-    use_coins = [x for x in use_coins if x.coin_object_id not in objects_in_use]
     # Make sure something left to pay for
     if use_coins:
         # Return constructs for createing bcs.GasData
         return bcs.GasData(
-            _coins_for_budget(use_coins, budget),
-            bcs.Address.from_str(signing.payer_address),
+            _coins_for_budget(use_coins, budget, not _specified_coins),
+            bcs.Address.from_str(payer),
             active_gas_price,
             budget,
         )
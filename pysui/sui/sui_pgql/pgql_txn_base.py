@@ -13,7 +13,7 @@ from typing import Any, Optional, Union
 import logging
 
 
-from pysui import SuiAddress, ObjectID
+from pysui import SuiAddress, ObjectID, SuiRpcResult
 
 from pysui.sui.sui_txresults.single_tx import (
     TransactionConstraints,
@@ -21,6 +21,7 @@ from pysui.sui.sui_txresults.single_tx import (
 
 from pysui.sui.sui_pgql.pgql_clients import BaseSuiGQLClient
 from pysui.sui.sui_pgql.pgql_txb_signing import SignerBlock, SigningMultiSig
+import pysui.sui.sui_pgql.pgql_txb_gas as gd
 import pysui.sui.sui_txn.transaction_builder as tx_builder
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 from pysui.sui.sui_types import bcs
@@ -244,6 +245,14 @@ class _SuiTransactionBase(_TransactionBase):
         """
         return base64.b64encode(self.raw_kind().serialize()).decode()
 
+    def _execution_result(self, result: SuiRpcResult) -> SuiRpcResult:
+        """Evict the retained dry run budget of the transaction if executing failed."""
+        if not (
+            result.is_ok() and getattr(result.result_data, "status", None) == "SUCCESS"
+        ):
+            gd.evict_dry_run_budget(self.raw_kind())
+        return result
+
     def verify_transaction(
         self, ser_kind: Optional[bytes] = None
     ) -> tuple[TransactionConstraints, Union[dict, None]]:
@@ -237,6 +237,28 @@ class SuiCoinObjectSummaryGQL(PGQL_Type):
         return clz.from_dict(ser_dict)
 
 
+@dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
+@dataclasses.dataclass
+class SuiCoinObjectSummariesGQL(PGQL_Type):
+    """Collection of coin summaries."""
+
+    data: list[SuiCoinObjectSummaryGQL]
+    next_cursor: PagingCursor
+
+    @classmethod
+    def from_query(clz, in_data: dict) -> "SuiCoinObjectSummariesGQL":
+        """Serializes query result to list of Sui coin summaries.
+
+        The in_data is a dictionary with 2 keys: 'cursor' and 'coin_objects'
+        """
+        in_data = in_data.pop("qres").pop("coins")
+        ncurs: PagingCursor = PagingCursor.from_dict(in_data["cursor"])
+        return SuiCoinObjectSummariesGQL(
+            [SuiCoinObjectSummaryGQL(**i_coin) for i_coin in in_data["coin_objects"]],
+            ncurs,
+        )
+
+
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
 @dataclasses.dataclass
 class SuiStakedCoinGQL:
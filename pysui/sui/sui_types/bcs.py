@@ -209,6 +209,37 @@ class ObjectReference(canoser.Struct):
             )
         raise ValueError(f"{indata} is not valid")
 
+    @classmethod
+    @versionadded(version="0.77.0", reason="Gas coin selection")
+    def from_gql_refs(
+        cls,
+        indata: list[
+            Union[pgql_type.SuiCoinObjectGQL, pgql_type.SuiCoinObjectSummaryGQL]
+        ],
+    ) -> list["ObjectReference"]:
+        """from_gql_refs init constructs for each of a list of GraphQL coins.
+
+        :param indata: The coins to reference
+        :type indata: list[Union[SuiCoinObjectGQL, SuiCoinObjectSummaryGQL]]
+        :return: The instantiated BCS objects, in order
+        :rtype: list[ObjectReference]
+        """
+        addr_from = Address.from_str
+        digest_from = Digest.from_str
+        coin_types = (pgql_type.SuiCoinObjectGQL, pgql_type.SuiCoinObjectSummaryGQL)
+        result: list["ObjectReference"] = []
+        for coin in indata:
+            if not isinstance(coin, coin_types):
+                raise ValueError(f"{coin} is not valid")
+            result.append(
+                cls(
+                    addr_from(coin.coin_object_id),
+                    coin.version,
+                    digest_from(coin.object_digest),
+                )
+            )
+        return result
+
 
 class SharedObjectReference(canoser.Struct):
     """SharedObjectReference represents a shared object by it's objects reference fields."""
@@ -13,11 +13,10 @@
 
 """Utility functions."""
 
+import functools
 import itertools
-import math
 import os
-import base64
-import binascii
+import re
 import subprocess
 import hashlib
 from dataclasses import dataclass
@@ -59,12 +58,29 @@ from pysui.sui.sui_excepts import (
 )
 from pysui.sui.sui_txresults.single_tx import ObjectRead, ObjectReadData
 
+# pybase64 is optional, a drop in replacement of the base64 functions
+try:
+    from pybase64 import b64decode as _b64decode, b64encode as _b64encode
+except ImportError:
+    from base64 import b64decode as _b64decode, b64encode as _b64encode
+
 
 # _SUI_BUILD: list[str] = ["sui", "move", "build", "-p"]
 # _SUI_BUILD_SKIP_GIT: list[str] = ["sui", "move", "build", "--skip-fetch-latest-git-deps", "-p"]
 _UNPUBLISHED: str = "0000000000000000000000000000000000000000000000000000000000000000"
 
-_SUI_BUILD: list[str] = ["move", "build"]
+_SUI_BUILD: tuple[str, ...] = ("move", "build")
+
+# libyaml's safe loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Canonical base64, padded with zero trailing bits, as b64encode produces it
+_B64_CANONICAL: str = (
+    r"(?:[A-Za-z0-9+/]{4})*"
+    r"(?:[A-Za-z0-9+/][AQgw]==|[A-Za-z0-9+/]{2}[AEIMQUYcgkosw048]=)?"
+)
+_B64_STR_RE: re.Pattern = re.compile(_B64_CANONICAL)
+_B64_BYTES_RE: re.Pattern = re.compile(_B64_CANONICAL.encode("ascii"))
 
 
 @dataclass
@@ -100,53 +116,36 @@ def _compile_project(
     :return: The path_to_package Path
     :rtype: Union[Path, SuiException]
     """
-    mbs = _SUI_BUILD.copy()
-    mbs.extend(args_list)
-    mbs.append("-p")
-    mbs.append(path_to_package)
-    # return " ".join(mbs)
-
-    mbs.insert(0, os.environ[PYSUI_EXEC_ENV])
-    result = subprocess.run(mbs, capture_output=True, text=True)
-    if result.returncode == 0:
-        return path_to_package
-    raise SuiPackageBuildFail(result.stdout)
+    return _compile_projectg(os.environ[PYSUI_EXEC_ENV], path_to_package, args_list)
 
 
 def _compile_projectg(
     sui_bin_str: str, path_to_package: Path, args_list: list[str]
 ) -> Union[Path, SuiException]:
     """_compile_projectg Compiles a sui move project in GraohQL environment."""
-    mbs = _SUI_BUILD.copy()
-    mbs.extend(args_list)
-    mbs.append("-p")
-    mbs.append(path_to_package)
-
-    mbs.insert(0, sui_bin_str)
-    result = subprocess.run(mbs, capture_output=True, text=True)
+    mbs = [sui_bin_str, *_SUI_BUILD, *args_list, "-p", path_to_package]
+    # Output is only decoded when reporting a failed build
+    result = subprocess.run(mbs, capture_output=True, stdin=subprocess.DEVNULL)
     if result.returncode == 0:
         return path_to_package
-    raise SuiPackageBuildFail(result.stdout)
+    raise SuiPackageBuildFail(result.stdout.decode("utf-8", errors="replace"))
 
 
 def _build_dep_info(build_path: str) -> Union[CompiledPackageRaw, Exception]:
     """Fetch details about build."""
     build_info = Path(build_path).joinpath("BuildInfo.yaml")
     if build_info.exists():
-        build_info_dict = yaml.safe_load(build_info.read_text(encoding="utf-8"))[
-            "compiled_package_info"
-        ]
+        build_info_dict = yaml.load(
+            build_info.read_text(encoding="utf-8"), Loader=_YAML_LOADER
+        )["compiled_package_info"]
         pname = build_info_dict["package_name"].lower()
         inner_dep = build_info_dict["address_alias_instantiation"]
-        pindent = f"0x{inner_dep[pname]}"
-        dep_ids: list[ObjectID] = []
-        for key, value in inner_dep.items():
-            if key != pname:
-                dep_ids.append(f"0x{value}")
+        pindent = f"0x{inner_dep.pop(pname)}"
+        dep_ids: list[str] = [f"0x{x}" for x in inner_dep.values()]
         return CompiledPackageRaw(
             pname,
             pindent,
-            binascii.unhexlify(build_info_dict["source_digest"]),
+            bytes.fromhex(build_info_dict["source_digest"]),
             dep_ids,
         )
     raise ValueError("Corrupt publish build information")
@@ -155,26 +154,40 @@ def _build_dep_info(build_path: str) -> Union[CompiledPackageRaw, Exception]:
 def _package_digestg(package: CompiledPackageRaw, module_path: Path) -> None:
     """Captures compiled module bytes for publishing and digest calculation."""
 
-    mod_bytes: list[bytes] = []
-    all_digests: list[bytes] = []
-
     mod_list = list(module_path.glob("*.mv"))
     if not mod_list:
         raise ValueError(f"{module_path} is empty")
-    for mmod in mod_list:
-        binfile = mmod.read_bytes()
-        hasher = hashlib.blake2b(digest_size=32)
-        hasher.update(binfile)
-        all_digests.append(hasher.digest())
-        mod_bytes.append(list(binfile))
-    for dep_str in package.dependencies:
-        all_digests.append(binascii.unhexlify(dep_str[2:]))
+    binfiles: list[bytes] = [x.read_bytes() for x in mod_list]
+    all_digests: list[bytes] = [
+        hashlib.blake2b(x, digest_size=32).digest() for x in binfiles
+    ]
+    all_digests.extend(bytes.fromhex(x[2:]) for x in package.dependencies)
     all_digests.sort()
-    hasher = hashlib.blake2b(digest_size=32)
-    for bblock in all_digests:
-        hasher.update(bblock)
-    package.package_digest = hasher.digest()
-    package.compiled_modules = mod_bytes
+    # Hashing the joined digests equals updating with each in turn
+    package.package_digest = hashlib.blake2b(
+        b"".join(all_digests), digest_size=32
+    ).digest()
+    package.compiled_modules = [list(x) for x in binfiles]
+
+
+def _build_project_dir(path_to_package: Path) -> os.DirEntry:
+    """Find the single project folder of a package build."""
+    build_path = path_to_package.joinpath("build")
+    if not build_path.exists():
+        raise SuiMiisingBuildFolder(f"No build folder found in {path_to_package}")
+    build_subdir: os.DirEntry = None
+    with os.scandir(build_path) as entries:
+        for entry in entries:
+            if entry.is_dir() and entry.name != "locks":
+                # Stop at the second project folder
+                if build_subdir is not None:
+                    raise SuiMiisingBuildFolder(
+                        f"No build folder found in {path_to_package}"
+                    )
+                build_subdir = entry
+    if build_subdir is None:
+        raise SuiMiisingBuildFolder(f"No build folder found in {path_to_package}")
+    return build_subdir
 
 
 @versionchanged(
@@ -186,29 +199,23 @@ def publish_build(
     args_list: list[str],
 ) -> Union[CompiledPackageRaw, Exception]:
     """Build and collect module base64 strings and dependencies ObjectIDs."""
-    if os.environ[PYSUI_EXEC_ENV] == EMPEHMERAL_PATH:
+    # Read once, the environment is reset by each new configuration
+    sui_bin_str = os.environ[PYSUI_EXEC_ENV]
+    if sui_bin_str == EMPEHMERAL_PATH:
         raise ValueError(f"Configuration does not support publishing")
     # Compile the package
-    path_to_package = _compile_project(path_to_package, args_list)
-    # Find the build folder
-    build_path = path_to_package.joinpath("build")
-    if not build_path.exists():
-        raise SuiMiisingBuildFolder(f"No build folder found in {path_to_package}")
+    path_to_package = _compile_projectg(sui_bin_str, path_to_package, args_list)
     # Get the project folder
-    build_subdir = [
-        x for x in os.scandir(build_path) if x.is_dir() and x.name != "locks"
-    ]
-    if len(build_subdir) > 1:
-        raise SuiMiisingBuildFolder(f"No build folder found in {path_to_package}")
+    build_subdir = _build_project_dir(path_to_package)
     # Finally, get the module(s) bytecode folder
-    move_modules = Path(build_subdir[0]).joinpath("bytecode_modules")
+    move_modules = Path(build_subdir).joinpath("bytecode_modules")
     if not move_modules.exists():
         raise SuiMiisingBuildFolder(
             f"No bytecode_modules folder found for {path_to_package}/build"
         )
 
     # Construct initial package
-    cpackage = _build_dep_info(build_subdir[0].path)
+    cpackage = _build_dep_info(build_subdir.path)
     # Set module bytes as base64 strings and generate package digest
     _package_digestg(cpackage, move_modules)
     return cpackage
@@ -222,25 +229,17 @@ def publish_buildg(
     """Build and collect module base64 strings and dependencies ObjectIDs."""
     # Compile the package
     path_to_package = _compile_projectg(sui_bin_path_str, path_to_package, args_list)
-    # Find the build folder
-    build_path = path_to_package.joinpath("build")
-    if not build_path.exists():
-        raise SuiMiisingBuildFolder(f"No build folder found in {path_to_package}")
     # Get the project folder
-    build_subdir = [
-        x for x in os.scandir(build_path) if x.is_dir() and x.name != "locks"
-    ]
-    if len(build_subdir) > 1:
-        raise SuiMiisingBuildFolder(f"No build folder found in {path_to_package}")
+    build_subdir = _build_project_dir(path_to_package)
     # Finally, get the module(s) bytecode folder
-    byte_modules = Path(build_subdir[0]).joinpath("bytecode_modules")
+    byte_modules = Path(build_subdir).joinpath("bytecode_modules")
     if not byte_modules.exists():
         raise SuiMiisingBuildFolder(
             f"No bytecode_modules folder found for {path_to_package}/build"
         )
 
     # Construct initial package
-    cpackage = _build_dep_info(build_subdir[0].path)
+    cpackage = _build_dep_info(build_subdir.path)
     # Set module bytes as base64 strings and generate package digest
     _package_digestg(cpackage, byte_modules)
     return cpackage
@@ -260,16 +259,13 @@ def sui_base_get_config() -> tuple[Path, Path, Union[Path, None]]:
     astem = active_path.stem
     match astem:
         case "localnet" | "devnet" | "testnet":
+            config_path = Path(os.readlink(active_path.joinpath("config")))
             # client yaml
-            local_cfg = Path(os.readlink(active_path.joinpath("config"))).joinpath(
-                "client.yaml"
-            )
+            local_cfg = config_path.joinpath("client.yaml")
             if not local_cfg.exists():
                 raise ValueError(f"client.yaml not found {local_cfg}")
             # alias json
-            alias_file = Path(os.readlink(active_path.joinpath("config"))).joinpath(
-                "sui.aliases"
-            )
+            alias_file = config_path.joinpath("sui.aliases")
             # Sui binary
             sui_exec_path = Path(
                 os.readlink(active_path.joinpath("sui-repo"))
@@ -347,7 +343,7 @@ def hexstring_to_list(indata: str, default_fill_length: int = 64) -> list[int]:
     :return: converted indata to int list
     :rtype: list[int]
     """
-    return [int(x) for x in binascii.unhexlify(hexstring_to_sui_id(indata)[2:])]
+    return list(bytes.fromhex(hexstring_to_sui_id(indata)[2:]))
 
 
 def b64str_to_list(indata: str) -> list[int]:
@@ -358,8 +354,7 @@ def b64str_to_list(indata: str) -> list[int]:
     :return: converted indata to int list
     :rtype: list[int]
     """
-    b64bytes = base64.b64decode(indata)
-    return [int(x) for x in b64bytes]
+    return list(_b64decode(indata))
 
 
 def from_list_to_b58str(indata: list) -> str:
@@ -379,10 +374,11 @@ def b58str_to_list(indata: str) -> list[int]:
         decode_bytes = base58.b58decode(indata)
     # Fall back if invalid base58 str
     except ValueError:
-        decode_bytes = base64.b64decode(indata)
-    return [int(x) for x in decode_bytes]
+        decode_bytes = _b64decode(indata)
+    return list(decode_bytes)
 
 
+@versionchanged(version="0.77.0", reason="Zero pads integers smaller than byte_count")
 def int_to_listu8(byte_count: int, in_el: int) -> list[int]:
     """int_to_listu8 converts integer to array of u8 bytes.
 
@@ -390,19 +386,21 @@ def int_to_listu8(byte_count: int, in_el: int) -> list[int]:
     :type byte_count: int
     :param in_el: The integer elements
     :type in_el: int
-    :raises ValueError: If mismatch on expected and actual byte count
-    :return: the integer value converted to list of int (u8)
+    :raises ValueError: If the integer does not fit in the expected byte count
+    :return: the integer value converted to list of int (u8), zero padded
     :rtype: list[int]
     """
-    byte_res = math.ceil(in_el.bit_length() / 8)
-    if byte_res == byte_count:
-        return list(in_el.to_bytes(byte_res, "little"))
-    raise ValueError(f"Expected byte count {byte_count} found byte count {byte_res}")
+    if in_el.bit_length() > byte_count * 8:
+        raise ValueError(
+            f"Expected byte count {byte_count} found byte count {(in_el.bit_length() + 7) // 8}"
+        )
+    return list(in_el.to_bytes(byte_count, "little"))
 
 
 # Coercion utilities
 
 
+@functools.singledispatch
 def as_sui_address(in_data: Any) -> Union[SuiAddress, ValueError]:
     """as_sui_address coerces `in_data` to a SuiAddress.
 
@@ -413,27 +411,36 @@ def as_sui_address(in_data: Any) -> Union[SuiAddress, ValueError]:
     :return: A SuiAddress
     :rtype: Union[SuiAddress, ValueError]
     """
-    if isinstance(in_data, SuiAddress):
-        result = in_data
-    elif isinstance(in_data, (ObjectID, SuiString)):
-        if valid_sui_address(in_data.value):
-            result = SuiAddress(in_data.value)
-        else:
-            raise ValueError(
-                f"Type {in_data.__class__.__name__}: {in_data.value} is not a valid SuiAddress form."
-            )
-    elif isinstance(in_data, str):
-        if valid_sui_address(in_data):
-            result = SuiAddress(in_data)
-        else:
-            raise ValueError(f"str {in_data} is not a valid SuiAddress form.")
-    if not result:
-        raise ValueError(
-            f"Can not get SuiInteger from {in_data} with type {type(in_data)}"
-        )
-    return result
+    raise ValueError(
+        f"Can not get SuiAddress from {in_data} with type {type(in_data)}"
+    )
+
+
+@as_sui_address.register
+def _(in_data: SuiAddress) -> SuiAddress:
+    """."""
+    return in_data
+
+
+@as_sui_address.register
+def _(in_data: SuiString) -> SuiAddress:
+    """Includes ObjectID."""
+    if valid_sui_address(in_data.value):
+        return SuiAddress(in_data.value)
+    raise ValueError(
+        f"Type {in_data.__class__.__name__}: {in_data.value} is not a valid SuiAddress form."
+    )
 
 
+@as_sui_address.register
+def _(in_data: str) -> SuiAddress:
+    """."""
+    if valid_sui_address(in_data):
+        return SuiAddress(in_data)
+    raise ValueError(f"str {in_data} is not a valid SuiAddress form.")
+
+
+@functools.singledispatch
 def as_object_id(in_data: Any) -> Union[ObjectID, ValueError]:
     """as_object_id coerces `in_data` to an ObjectID.
 
@@ -444,30 +451,54 @@ def as_object_id(in_data: Any) -> Union[ObjectID, ValueError]:
     :return: An ObjectID
     :rtype: Union[ObjectID, Union[ValueError, AttributeError]]
     """
-    result = SuiNullType()
-    # object_id: ObjectID = None
-    if isinstance(in_data, ObjectID):
-        result = in_data
-    elif isinstance(in_data, str):
-        result = ObjectID(in_data)
-    elif isinstance(in_data, (ObjectRead, ObjectReadData)):
-        result = in_data.identifier
-    elif isinstance(in_data, SuiString):
-        result = ObjectID(in_data.value)
-    elif issubclass(type(in_data), SuiAddress):
-        result = ObjectID(in_data.identifier.value)
-    elif issubclass(type(in_data), DataClassJsonMixin):
-        if hasattr(in_data, "identifier"):
-            result = in_data.identifier
-            if isinstance(result, str):
-                result = ObjectID(result)
-    if not result:
+    if in_data is None:
+        return SuiNullType()
+    raise ValueError(f"Can not get ObjectID from {in_data} with type {type(in_data)}")
+
+
+@as_object_id.register
+def _(in_data: ObjectID) -> ObjectID:
+    """."""
+    return in_data
+
+
+@as_object_id.register
+def _(in_data: str) -> ObjectID:
+    """."""
+    return ObjectID(in_data)
+
+
+@as_object_id.register(ObjectRead)
+@as_object_id.register(ObjectReadData)
+def _(in_data: Union[ObjectRead, ObjectReadData]) -> ObjectID:
+    """."""
+    return in_data.identifier
+
+
+@as_object_id.register
+def _(in_data: SuiString) -> ObjectID:
+    """."""
+    return ObjectID(in_data.value)
+
+
+@as_object_id.register
+def _(in_data: SuiAddress) -> ObjectID:
+    """."""
+    return ObjectID(in_data.identifier.value)
+
+
+@as_object_id.register
+def _(in_data: DataClassJsonMixin) -> ObjectID:
+    """Results carrying an identifier."""
+    if not hasattr(in_data, "identifier"):
         raise ValueError(
             f"Can not get ObjectID from {in_data} with type {type(in_data)}"
         )
-    return result
+    result = in_data.identifier
+    return ObjectID(result) if isinstance(result, str) else result
 
 
+@functools.singledispatch
 def as_sui_string(in_data: Any) -> Union[SuiString, ValueError]:
     """as_sui_string coerces `in_data` to a SuiString.
 
@@ -477,23 +508,35 @@ def as_sui_string(in_data: Any) -> Union[SuiString, ValueError]:
     :return: A SuiString
     :rtype: Union[SuiString, ValueError]
     """
-    if isinstance(in_data, SuiString):
-        result = in_data
-    elif isinstance(in_data, str):
-        result = SuiString(in_data)
-    elif isinstance(in_data, int):
-        result = SuiString(str(in_data))
-    elif issubclass(type(in_data), SuiAddress):
-        result = SuiString(in_data.identifier.value)
-    elif isinstance(in_data, SuiNullType):
-        result = in_data
-    if not result:
-        raise ValueError(
-            f"Can not get SuiString from {in_data} with type {type(in_data)}"
-        )
-    return result
+    raise ValueError(f"Can not get SuiString from {in_data} with type {type(in_data)}")
+
+
+@as_sui_string.register(SuiString)
+@as_sui_string.register(SuiNullType)
+def _(in_data: Union[SuiString, SuiNullType]) -> Union[SuiString, SuiNullType]:
+    """."""
+    return in_data
+
+
+@as_sui_string.register
+def _(in_data: str) -> SuiString:
+    """."""
+    return SuiString(in_data)
+
+
+@as_sui_string.register
+def _(in_data: int) -> SuiString:
+    """."""
+    return SuiString(str(in_data))
+
 
+@as_sui_string.register
+def _(in_data: SuiAddress) -> SuiString:
+    """."""
+    return SuiString(in_data.identifier.value)
 
+
+@functools.singledispatch
 def as_sui_integer(in_data: Any) -> Union[SuiInteger, ValueError]:
     """as_sui_integer coerces `in_data` to a SuiInteger.
 
@@ -503,21 +546,33 @@ def as_sui_integer(in_data: Any) -> Union[SuiInteger, ValueError]:
     :return: A SuiInteger
     :rtype: Union[SuiInteger, ValueError]
     """
-    result = SuiNullType()
-    if isinstance(in_data, SuiInteger):
-        result = in_data
-    elif isinstance(in_data, int):
-        result = SuiInteger(in_data)
-    elif isinstance(in_data, str):
-        int_only = in_data.split(".")[0]
-        result = SuiInteger(int(int_only))
-    if not result:
-        raise ValueError(
-            f"Can not get SuiInteger from {in_data} with type {type(in_data)}"
-        )
-    return result
+    if in_data is None:
+        return SuiNullType()
+    raise ValueError(
+        f"Can not get SuiInteger from {in_data} with type {type(in_data)}"
+    )
 
 
+@as_sui_integer.register
+def _(in_data: SuiInteger) -> SuiInteger:
+    """."""
+    return in_data
+
+
+@as_sui_integer.register
+def _(in_data: int) -> SuiInteger:
+    """."""
+    return SuiInteger(in_data)
+
+
+@as_sui_integer.register
+def _(in_data: str) -> SuiInteger:
+    """Drops any fractional part."""
+    int_only = in_data.split(".")[0]
+    return SuiInteger(int(int_only))
+
+
+@functools.singledispatch
 def as_sui_array(in_data: Any) -> Union[SuiArray, ValueError]:
     """as_sui_array coerces `in_data` to a SuiArray.
 
@@ -527,19 +582,28 @@ def as_sui_array(in_data: Any) -> Union[SuiArray, ValueError]:
     :return: A SuiArray
     :rtype: Union[SuiArray, ValueError]
     """
-    if isinstance(in_data, SuiArray):
-        result = in_data
-    elif isinstance(in_data, list):
-        result = SuiArray(in_data)
-    elif isinstance(in_data, tuple):
-        result = SuiArray(list(in_data))
-    if not result:
-        raise ValueError(
-            f"Can not get SuiArray from {in_data} with type {type(in_data)}"
-        )
-    return result
+    raise ValueError(f"Can not get SuiArray from {in_data} with type {type(in_data)}")
+
+
+@as_sui_array.register
+def _(in_data: SuiArray) -> SuiArray:
+    """."""
+    return in_data
+
+
+@as_sui_array.register
+def _(in_data: list) -> SuiArray:
+    """."""
+    return SuiArray(in_data)
 
 
+@as_sui_array.register
+def _(in_data: tuple) -> SuiArray:
+    """."""
+    return SuiArray(list(in_data))
+
+
+@functools.singledispatch
 def as_sui_map(in_data: Any) -> Union[SuiMap, ValueError]:
     """as_sui_map coerces `in_data` to a SuiMap.
 
@@ -549,42 +613,61 @@ def as_sui_map(in_data: Any) -> Union[SuiMap, ValueError]:
     :return: A SuiMap
     :rtype: Union[SuiMap, ValueError]
     """
-    result = None
-    if isinstance(in_data, SuiMap):
-        result = in_data
-    elif isinstance(in_data, dict):
-        result = SuiMap("", "")
-        result.map = in_data
-    elif isinstance(in_data, SuiNullType):
-        result = SuiMap("", "")
-        result.map = {}
-    if not result:
-        raise ValueError(f"Can not get SuiMap from {in_data} with type {type(in_data)}")
+    raise ValueError(f"Can not get SuiMap from {in_data} with type {type(in_data)}")
+
+
+@as_sui_map.register
+def _(in_data: SuiMap) -> SuiMap:
+    """."""
+    return in_data
+
+
+@as_sui_map.register
+def _(in_data: dict) -> SuiMap:
+    """."""
+    result = SuiMap("", "")
+    result.map = in_data
+    return result
+
+
+@as_sui_map.register
+def _(in_data: SuiNullType) -> SuiMap:
+    """."""
+    result = SuiMap("", "")
+    result.map = {}
     return result
 
 
+@functools.singledispatch
 def as_sui_boolean(in_data: Any) -> Union[SuiBoolean, ValueError]:
     """as_sui_boolean coerces `in_data` to a SuiBoolean.
 
+    Types not otherwise handled are coerced by their truthiness.
+
     :param in_data: Data to attempt coercion with
     :type in_data: Any
-    :raises ValueError: If `in_data` type is not handled by this utility.
     :return: A SuiBoolean
     :rtype: Union[SuiBoolean, ValueError]
     """
-    if isinstance(in_data, SuiBoolean):
-        result = in_data
-    elif isinstance(in_data, bool):
-        result = SuiBoolean(in_data)
-    elif isinstance(in_data, int):
-        result = SuiBoolean(False) if in_data == 0 else SuiBoolean(True)
-    else:
-        result = SuiBoolean(True) if in_data else SuiBoolean(False)
-    if not result:
-        raise ValueError(
-            f"Can not get SuiBoolean from {in_data} with type {type(in_data)}"
-        )
-    return result
+    return SuiBoolean(bool(in_data))
+
+
+@as_sui_boolean.register
+def _(in_data: SuiBoolean) -> SuiBoolean:
+    """."""
+    return in_data
+
+
+@as_sui_boolean.register
+def _(in_data: bool) -> SuiBoolean:
+    """."""
+    return SuiBoolean(in_data)
+
+
+@as_sui_boolean.register
+def _(in_data: int) -> SuiBoolean:
+    """."""
+    return SuiBoolean(in_data != 0)
 
 
 def is_base_64(str_or_bytes: Union[str, bytes, bytearray]) -> bool:
@@ -596,17 +679,11 @@ def is_base_64(str_or_bytes: Union[str, bytes, bytearray]) -> bool:
     :return: True if is valid base64
     :rtype: bool
     """
-    try:
-        if isinstance(str_or_bytes, str):
-            # If there's any unicode here, an exception will be thrown and the function will return false
-            sb_bytes = bytes(str_or_bytes, "ascii")
-        elif isinstance(str_or_bytes, (bytes, bytearray)):
-            sb_bytes = str_or_bytes
-        else:
-            raise ValueError("Argument must be string, bytes or bytearray")
-        return base64.b64encode(base64.b64decode(sb_bytes)) == sb_bytes
-    except binascii.Error:
-        return False
+    if isinstance(str_or_bytes, str):
+        return _B64_STR_RE.fullmatch(str_or_bytes) is not None
+    if isinstance(str_or_bytes, (bytes, bytearray)):
+        return _B64_BYTES_RE.fullmatch(str_or_bytes) is not None
+    raise ValueError("Argument must be string, bytes or bytearray")
 
 
 def to_base_64(in_data: Any, clz: Any) -> Union[Any, ValueError]:
@@ -626,7 +703,7 @@ def to_base_64(in_data: Any, clz: Any) -> Union[Any, ValueError]:
         result = clz(in_data)
     elif isinstance(in_data, (str, bytes, bytearray)):
         in_data = in_data if not isinstance(in_data, str) else bytes(in_data, "utf-16")
-        result = clz(base64.b64encode(in_data))
+        result = clz(_b64encode(in_data))
     if not result:
         raise ValueError(
             f"Can not get {clz.__class__.__name__} from {in_data} with type {type(clz)}"
@@ -658,6 +735,7 @@ def as_sui_signature(in_data: Any) -> Union[SuiSignature, ValueError]:
     return to_base_64(in_data, SuiSignature)
 
 
+@functools.singledispatch
 def as_sui_txdigest(in_data: Any) -> Union[SuiTransactionDigest, ValueError]:
     """as_sui_txdigest coerces `in_data` to a SuiTransactionDigest.
 
@@ -667,17 +745,27 @@ def as_sui_txdigest(in_data: Any) -> Union[SuiTransactionDigest, ValueError]:
     :return: A SuiTransactionDigest
     :rtype: Union[SuiTransactionDigest, ValueError]
     """
-    if isinstance(in_data, SuiTransactionDigest):
-        result = in_data
-    elif isinstance(in_data, SuiString):
-        result = SuiTransactionDigest(in_data.value)
-    elif isinstance(in_data, str):
-        result = SuiTransactionDigest(in_data)
-    if not result:
-        raise ValueError(
-            f"Can not get SuiTransactionDigest from {in_data} with type {type(in_data)}"
-        )
-    return result
+    raise ValueError(
+        f"Can not get SuiTransactionDigest from {in_data} with type {type(in_data)}"
+    )
+
+
+@as_sui_txdigest.register
+def _(in_data: SuiTransactionDigest) -> SuiTransactionDigest:
+    """."""
+    return in_data
+
+
+@as_sui_txdigest.register
+def _(in_data: SuiString) -> SuiTransactionDigest:
+    """."""
+    return SuiTransactionDigest(in_data.value)
+
+
+@as_sui_txdigest.register
+def _(in_data: str) -> SuiTransactionDigest:
+    """."""
+    return SuiTransactionDigest(in_data)
 
 
 #: Keys are the end product pysui type and the value (set) are the types it can convert from.
@@ -0,0 +1,174 @@
+#    Copyright 2022 Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Fixtures for offline testing with stub GraphQL sessions."""
+
+import asyncio
+import re
+from typing import Any, Callable
+
+import pytest
+from gql.dsl import DSLQuery, DSLSchema, dsl_gql
+from graphql import DocumentNode, build_schema, print_ast
+
+from pysui.sui.sui_pgql.pgql_clients import (
+    AsyncSuiGQLClient,
+    BaseSuiGQLClient,
+    PGQL_QueryNode,
+    SuiGQLClient,
+)
+import pysui.sui.sui_pgql.pgql_schema as scm
+
+_ROOT_FIELD = re.compile(
+    r"^  (?:(\w+): )?(chainIdentifier|epoch)(?:\(id: (\d+)\))?", re.M
+)
+
+_STUB_SDL: str = """
+type Query {
+    chainIdentifier: String!
+    epoch(id: Int): Epoch
+}
+type Epoch {
+    epochId: Int!
+    referenceGasPrice: String
+}
+"""
+
+
+class ChainIdNode(PGQL_QueryNode):
+    """Query without arguments."""
+
+    IS_READ_ONLY: bool = True
+
+    def as_document_node(self, schema: DSLSchema) -> DocumentNode:
+        """."""
+        return dsl_gql(DSLQuery(schema.Query.chainIdentifier))
+
+
+class EpochNode(PGQL_QueryNode):
+    """Query of an epoch, stable for a given id."""
+
+    IS_STABLE: bool = True
+    IS_READ_ONLY: bool = True
+
+    def __init__(self, *, epoch_id: int):
+        """."""
+        self.epoch_id = epoch_id
+
+    def as_document_node(self, schema: DSLSchema) -> DocumentNode:
+        """."""
+        return dsl_gql(
+            DSLQuery(
+                schema.Query.epoch(id=self.epoch_id).select(
+                    schema.Epoch.epochId, schema.Epoch.referenceGasPrice
+                )
+            )
+        )
+
+    @staticmethod
+    def encode_fn() -> Callable[[dict], Any]:
+        """Return the epoch dictionary."""
+        return lambda x: x["epoch"]
+
+
+class UnsharedEpochNode(EpochNode):
+    """Epoch query not declared read only or stable."""
+
+    IS_STABLE: bool = False
+    IS_READ_ONLY: bool = False
+
+
+class StubSession:
+    """Records executed documents and answers them with a responder."""
+
+    def __init__(self, responder: Callable[[str], dict]):
+        """."""
+        self.responder = responder
+        self.queries: list[str] = []
+
+    def execute(self, document: DocumentNode, **kwargs) -> dict:
+        """."""
+        query = print_ast(document)
+        self.queries.append(query)
+        return self.responder(query)
+
+
+class AsyncStubSession(StubSession):
+    """Async StubSession."""
+
+    async def execute(self, document: DocumentNode, **kwargs) -> dict:
+        """Yield once so concurrent executions overlap."""
+        await asyncio.sleep(0)
+        return StubSession.execute(self, document, **kwargs)
+
+
+class _StubSyncClient:
+    """Stands in for the gql sync client of a Schema."""
+
+    def __init__(self, session: StubSession):
+        """."""
+        self.session = session
+
+    def connect_sync(self) -> StubSession:
+        """."""
+        return self.session
+
+
+def _stub_schema() -> scm.Schema:
+    """Return a Schema over the stub SDL without connecting."""
+    schema: scm.Schema = object.__new__(scm.Schema)
+    schema._static_documents = {}
+    schema._frozen_queries = {}
+    schema._dsl_schema = DSLSchema(build_schema(_STUB_SDL))
+    schema._graph_url = "http://stub/graphql"
+    schema._async_client = None
+    return schema
+
+
+def default_responder(query: str) -> dict:
+    """Answer the root fields of a stub query, batched or not."""
+    result: dict = {}
+    for alias, field, epoch_id in _ROOT_FIELD.findall(query):
+        if field == "chainIdentifier":
+            result[alias or field] = "4c78adac"
+        else:
+            result[alias or field] = {
+                "epochId": int(epoch_id),
+                "referenceGasPrice": "1000",
+            }
+    return result
+
+
+@pytest.fixture
+def sync_stub() -> tuple[SuiGQLClient, StubSession]:
+    """A sync client executing on a StubSession."""
+    session = StubSession(default_responder)
+    schema = _stub_schema()
+    schema._sync_client = _StubSyncClient(session)
+    client: SuiGQLClient = object.__new__(SuiGQLClient)
+    BaseSuiGQLClient.__init__(client, pysui_config=None, schema=schema)
+    return client, session
+
+
+@pytest.fixture
+def async_stub() -> tuple[AsyncSuiGQLClient, AsyncStubSession]:
+    """An async client executing on an AsyncStubSession."""
+    session = AsyncStubSession(default_responder)
+    schema = _stub_schema()
+    schema._async_session = session
+    client: AsyncSuiGQLClient = object.__new__(AsyncSuiGQLClient)
+    BaseSuiGQLClient.__init__(client, pysui_config=None, schema=schema)
+    client._slock = asyncio.Semaphore()
+    client._inflight = {}
+    return client, session
+
@@ -0,0 +1,115 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing async client coalescing and batching offline."""
+
+import asyncio
+from copy import deepcopy
+
+import pytest
+
+import pysui.sui.sui_pgql.pgql_clients as pgql_clients
+
+from tests.unit_tests.conftest import ChainIdNode, EpochNode, UnsharedEpochNode
+
+
+@pytest.mark.asyncio
+async def test_async_batch(async_stub):
+    """Test async QueryNodes are merged into one aliased request."""
+    client, session = async_stub
+    results = await client.execute_query_nodes(
+        with_nodes=[ChainIdNode(), UnsharedEpochNode(epoch_id=4)]
+    )
+    assert len(session.queries) == 1
+    assert "q1_epoch: epoch(id: 4)" in session.queries[0]
+    assert results[0].result_data == {"chainIdentifier": "4c78adac"}
+    assert results[1].result_data["epochId"] == 4
+
+
+@pytest.mark.asyncio
+async def test_coalesce_read_only(async_stub):
+    """Test concurrent identical read only QueryNodes share one request."""
+    client, session = async_stub
+    results = await asyncio.gather(
+        *[client.execute_query_node(with_node=EpochNode(epoch_id=3)) for _ in range(3)]
+    )
+    assert len(session.queries) == 1
+    assert not client._inflight
+    assert all(x.is_ok() for x in results)
+    # Each caller holds it's own copy
+    results[0].result_data["referenceGasPrice"] = "changed"
+    assert results[1].result_data["referenceGasPrice"] == "1000"
+    assert results[1].result_data is not results[2].result_data
+
+
+@pytest.mark.asyncio
+async def test_coalesce_distinct(async_stub):
+    """Test QueryNodes with different arguments are not coalesced."""
+    client, session = async_stub
+    results = await asyncio.gather(
+        client.execute_query_node(with_node=ChainIdNode()),
+        client.execute_query_node(with_node=EpochNode(epoch_id=3)),
+        client.execute_query_node(with_node=EpochNode(epoch_id=4)),
+    )
+    assert len(session.queries) == 3
+    assert [x.result_data["epochId"] for x in results[1:]] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_no_coalesce(async_stub):
+    """Test QueryNodes not read only, or with headers, are not coalesced."""
+    client, session = async_stub
+    await asyncio.gather(
+        *[
+            client.execute_query_node(with_node=UnsharedEpochNode(epoch_id=3))
+            for _ in range(3)
+        ]
+    )
+    assert len(session.queries) == 3
+    await asyncio.gather(
+        *[
+            client.execute_query_node(with_node=ChainIdNode(), with_headers={"a": "b"})
+            for _ in range(2)
+        ]
+    )
+    assert len(session.queries) == 5
+
+
+@pytest.mark.asyncio
+async def test_coalesce_copies_joiners(async_stub, monkeypatch):
+    """Test only callers joining a pending request get a copy."""
+    client, session = async_stub
+    copies: list = []
+
+    def _deepcopy(result):
+        copies.append(result)
+        return deepcopy(result)
+
+    monkeypatch.setattr(pgql_clients, "deepcopy", _deepcopy)
+    await client.execute_query_node(with_node=ChainIdNode())
+    assert not copies
+
+    async def _change():
+        result = await client.execute_query_node(with_node=ChainIdNode())
+        result.result_data["chainIdentifier"] = "changed"
+        return result
+
+    results = await asyncio.gather(
+        _change(),
+        client.execute_query_node(with_node=ChainIdNode()),
+        client.execute_query_node(with_node=ChainIdNode()),
+    )
+    assert len(session.queries) == 2
+    assert len(copies) == 2
+    assert results[0].result_data["chainIdentifier"] == "changed"
+    assert all(x.result_data["chainIdentifier"] == "4c78adac" for x in results[1:])
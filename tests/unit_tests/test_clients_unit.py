@@ -0,0 +1,200 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing the sync client offline."""
+
+import logging
+
+import httpx
+from gql import gql
+from gql.transport.exceptions import TransportQueryError
+
+from pysui.sui.sui_pgql.pgql_schema import _SuiHTTPXTransport, _SuiSyncClient
+from tests.unit_tests.conftest import ChainIdNode, EpochNode, UnsharedEpochNode
+
+
+def test_batch_one_request(sync_stub):
+    """Test QueryNodes are merged into one aliased request."""
+    client, session = sync_stub
+    results = client.execute_query_nodes(
+        with_nodes=[
+            ChainIdNode(),
+            EpochNode(epoch_id=3),
+            UnsharedEpochNode(epoch_id=4),
+        ]
+    )
+    assert len(session.queries) == 1
+    query = session.queries[0]
+    assert "q0_chainIdentifier: chainIdentifier" in query
+    assert "q1_epoch: epoch(id: 3)" in query
+    assert "q2_epoch: epoch(id: 4)" in query
+    assert all(x.is_ok() for x in results)
+    assert results[0].result_data == {"chainIdentifier": "4c78adac"}
+    # Each QueryNode's encode_fn applies to it's own portion
+    assert results[1].result_data == {"epochId": 3, "referenceGasPrice": "1000"}
+    assert results[2].result_data["epochId"] == 4
+
+
+def test_batch_unbatched(sync_stub):
+    """Test batch=False executes each QueryNode in turn."""
+    client, session = sync_stub
+    results = client.execute_query_nodes(
+        with_nodes=[ChainIdNode(), UnsharedEpochNode(epoch_id=4)], batch=False
+    )
+    assert len(session.queries) == 2
+    assert "q0_" not in session.queries[0]
+    assert results[1].result_data["epochId"] == 4
+
+
+def test_batch_error_to_all(sync_stub):
+    """Test a failed batched request is the result of each QueryNode."""
+    client, session = sync_stub
+
+    def _fail(query: str) -> dict:
+        raise TransportQueryError("boom", errors=[{"message": "boom"}])
+
+    session.responder = _fail
+    results = client.execute_query_nodes(
+        with_nodes=[ChainIdNode(), UnsharedEpochNode(epoch_id=4)]
+    )
+    assert len(results) == 2
+    assert all(x.is_err() for x in results)
+    assert results[0].result_string.startswith("TransportQueryError")
+    assert results[0] is not results[1]
+    assert results[0].result_data is not results[1].result_data
+
+
+def test_batch_invalid_nodes(sync_stub):
+    """Test QueryNodes that can not be batched give a result per QueryNode."""
+    client, session = sync_stub
+    results = client.execute_query_nodes(with_nodes=[ChainIdNode(), "not a node"])
+    assert not session.queries
+    assert all(x.is_err() for x in results)
+    assert results[0] is not results[1]
+
+
+def test_sync_session_persists():
+    """Test the sync client session is reused and reconnects once closed."""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"data": {"chainIdentifier": "4c78adac"}})
+
+    transport = _SuiHTTPXTransport(
+        url="http://stub/graphql", transport=httpx.MockTransport(_handler)
+    )
+    client = _SuiSyncClient(transport=transport)
+    session = client.connect_sync()
+    http_client = transport.client
+    client.execute(gql("{ chainIdentifier }"))
+    with client as wsession:
+        assert wsession is session
+        wsession.execute(gql("{ chainIdentifier }"))
+    assert transport.client is http_client
+    client.close_sync()
+    assert transport.client is None
+    assert client.execute(gql("{ chainIdentifier }")) == {
+        "chainIdentifier": "4c78adac"
+    }
+    assert transport.client is not None
+    assert len(requests) == 3
+    client.close_sync()
+
+
+def test_static_document_reused(sync_stub):
+    """Test a static QueryNode's DocumentNode is built once."""
+    client, _ = sync_stub
+    assert client._qnode_document(ChainIdNode()) is client._qnode_document(
+        ChainIdNode()
+    )
+    assert client._qnode_document(
+        UnsharedEpochNode(epoch_id=1)
+    ) is not client._qnode_document(UnsharedEpochNode(epoch_id=1))
+
+
+def test_stable_cached(sync_stub):
+    """Test stable QueryNode responses are retained and copied."""
+    client, session = sync_stub
+    first = client.execute_query_node(with_node=EpochNode(epoch_id=3))
+    first.result_data["referenceGasPrice"] = "changed"
+    second = client.execute_query_node(with_node=EpochNode(epoch_id=3))
+    assert len(session.queries) == 1
+    assert second.result_data == {"epochId": 3, "referenceGasPrice": "1000"}
+    client.execute_query_node(with_node=EpochNode(epoch_id=4))
+    assert len(session.queries) == 2
+
+
+def test_stable_not_cached(sync_stub):
+    """Test responses are not retained for headers, nulls or unstable nodes."""
+    client, session = sync_stub
+    client.execute_query_node(with_node=UnsharedEpochNode(epoch_id=3))
+    client.execute_query_node(with_node=UnsharedEpochNode(epoch_id=3))
+    assert len(session.queries) == 2
+    client.execute_query_node(with_node=EpochNode(epoch_id=3), with_headers={"a": "b"})
+    client.execute_query_node(with_node=EpochNode(epoch_id=3), with_headers={"a": "b"})
+    assert len(session.queries) == 4
+    session.responder = lambda _: {"epoch": None}
+    client.execute_query_node(with_node=EpochNode(epoch_id=9))
+    client.execute_query_node(with_node=EpochNode(epoch_id=9))
+    assert len(session.queries) == 6
+
+
+def test_stable_cache_bound(sync_stub):
+    """Test the response cache evicts the least recently used."""
+    client, session = sync_stub
+    client.RESPONSE_CACHE_SIZE = 2
+    for epoch_id in (1, 2, 1, 3):
+        client.execute_query_node(with_node=EpochNode(epoch_id=epoch_id))
+    assert len(session.queries) == 3
+    client.execute_query_node(with_node=EpochNode(epoch_id=1))
+    assert len(session.queries) == 3
+    client.execute_query_node(with_node=EpochNode(epoch_id=2))
+    assert len(session.queries) == 4
+
+
+def test_transport_logs_response(caplog):
+    """Test the transport decodes the response and keeps gql's debug logging."""
+    transport = _SuiHTTPXTransport(
+        url="http://stub/graphql",
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(200, json={"data": {"chainIdentifier": "4c"}})
+        ),
+    )
+    transport.connect()
+    with caplog.at_level(logging.DEBUG, logger="gql.transport.httpx"):
+        result = transport.execute(gql("{ chainIdentifier }"))
+    transport.close()
+    assert result.data == {"chainIdentifier": "4c"}
+    assert any(x.getMessage().startswith("<<< ") for x in caplog.records)
+
+
+def test_transport_frozen_query(caplog):
+    """Test static documents post their pre-printed query and are logged."""
+    posted: list[bytes] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        posted.append(request.content)
+        return httpx.Response(200, json={"data": {"chainIdentifier": "4c"}})
+
+    transport = _SuiHTTPXTransport(
+        url="http://stub/graphql", transport=httpx.MockTransport(_handler)
+    )
+    document = gql("{ chainIdentifier }")
+    transport.frozen_queries = {id(document): "query Frozen { chainIdentifier }"}
+    transport.connect()
+    with caplog.at_level(logging.DEBUG, logger="gql.transport.httpx"):
+        transport.execute(document)
+    transport.close()
+    assert b"query Frozen" in posted[0]
+    assert any(x.getMessage().startswith(">>> ") for x in caplog.records)
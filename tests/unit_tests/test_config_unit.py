@@ -0,0 +1,118 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing configuration model serialization and lookups."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pysui.sui.sui_pgql.config.confgroup import Profile, ProfileGroup
+from pysui.sui.sui_pgql.config.confmodel import PysuiConfigModel
+
+
+@pytest.fixture
+def group() -> ProfileGroup:
+    """A group of two keypairs and profiles."""
+    group = ProfileGroup("unit", "devnet", "", [], [], [], [])
+    for alias in ("Primary", "Secondary"):
+        _, address, key, prf_alias = ProfileGroup.new_keypair_parts(
+            alias=alias, alias_list=group.alias_list
+        )
+        group.add_keypair_and_parts(
+            new_address=address,
+            new_alias=prf_alias,
+            new_key=key,
+            make_active=alias == "Primary",
+        )
+    group.add_profile(new_prf=Profile("devnet", "https://devnet/graphql"))
+    group.add_profile(
+        new_prf=Profile(
+            "localnet",
+            "http://127.0.0.1:9125/graphql",
+            "http://127.0.0.1:9123/gas",
+            "http://127.0.0.1:9123/v1/status",
+        )
+    )
+    return group
+
+
+def test_group_round_trip(group: ProfileGroup):
+    """Test a group survives to_dict and from_dict through json."""
+    gdict = group.to_dict()
+    restored = ProfileGroup.from_dict(json.loads(json.dumps(gdict)))
+    assert restored == group
+    assert restored.to_dict() == gdict
+    # Lookup indexes are rebuilt
+    for index, address in enumerate(group.address_list):
+        alias = group.alias_list[index].alias
+        assert restored.address_for_alias(alias=alias) == address
+        assert restored.alias_name_for_address(address=address) == alias
+        assert (
+            restored.keypair_for_address(address=address).serialize()
+            == group.key_list[index].private_key_base64
+        )
+    assert restored.active_alias == "Primary"
+    localnet = restored._profile_exists(profile_name="localnet")
+    assert localnet.faucet_url == "http://127.0.0.1:9123/gas"
+    assert not restored._profile_exists(profile_name="mainnet")
+
+
+def test_model_round_trip(group: ProfileGroup):
+    """Test the configuration model survives to_dict and from_dict."""
+    model = PysuiConfigModel("1.0.0", "~/.cargo/bin/sui", "unit", [group])
+    mdict = model.to_dict()
+    restored = PysuiConfigModel.from_dict(json.loads(json.dumps(mdict)))
+    assert restored.to_dict() == mdict
+    assert restored.active_group.group_name == "unit"
+    assert restored.active_address == group.using_address
+    assert restored.has_group(group_name="unit")
+    assert not restored.has_group(group_name="other")
+
+
+def test_group_lookups(group: ProfileGroup):
+    """Test lookup indexes follow changes to the group."""
+    address = group.replace_alias_name(from_alias="Secondary", to_alias="Other")
+    assert group.address_for_alias(alias="Other") == address
+    with pytest.raises(ValueError):
+        group.address_for_alias(alias="Secondary")
+    group.active_alias = "Other"
+    assert group.active_address == address
+    with pytest.raises(ValueError):
+        group.add_keypair_and_parts(
+            new_address=address,
+            new_alias=group.alias_list[0],
+            new_key=group.key_list[0],
+        )
+    group.remove_profile(profile_name="localnet")
+    assert group.profile_names == ["devnet"]
+    with pytest.raises(ValueError):
+        group.get_profile("localnet")
+
+
+def test_gql_group_aliases(group: ProfileGroup):
+    """Test renaming an alias in a group initialized from another leaves it as is."""
+    model = PysuiConfigModel("1.0.0", "", "unit", [group])
+    model.initialize_gql_rpc(
+        sui_binary=Path("/not/a/sui"),
+        gql_rpc_group_name="gql",
+        json_rpc_group_name="unit",
+    )
+    gql_group = model.get_group(group_name="gql")
+    address = gql_group.replace_alias_name(from_alias="Primary", to_alias="Renamed")
+    assert gql_group.address_for_alias(alias="Renamed") == address
+    assert group.address_for_alias(alias="Primary") == address
+    with pytest.raises(ValueError):
+        group.address_for_alias(alias="Renamed")
+    assert group.alias_list[0].alias == "Primary"
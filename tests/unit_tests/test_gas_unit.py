@@ -0,0 +1,287 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing gas budget retention and coin selection offline."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_async_txn import AsyncSuiTransaction
+from pysui.sui.sui_pgql.pgql_sync_txn import SuiTransaction
+import pysui.sui.sui_pgql.pgql_query as qn
+import pysui.sui.sui_pgql.pgql_txb_gas as gd
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_txn.transaction_builder import PureInput
+import pysui.sui.sui_txn.transaction_builder as tx_builder
+from pysui.sui.sui_types import bcs
+
+SENDER: str = "0x" + "1" * 64
+SIGNING = SimpleNamespace(payer_address=SENDER, sender_str=SENDER, sponsor_str=None)
+
+
+def _coin(index: int, balance: int) -> pgql_type.SuiCoinObjectGQL:
+    """Return a SUI coin of balance."""
+    return pgql_type.SuiCoinObjectGQL(
+        "0x2::coin::Coin<0x2::sui::SUI>",
+        1,
+        "11111111111111111111111111111111",
+        str(balance),
+        True,
+        f"0x{index:064x}",
+        pgql_type.SuiObjectOwnedAddress("AddressOwner", SENDER),
+    )
+
+
+def _owned_kind(value: int = 1) -> bcs.TransactionKind:
+    """Return a programmable TransactionKind of pure inputs."""
+    return bcs.TransactionKind(
+        "ProgrammableTransaction",
+        bcs.ProgrammableTransaction([bcs.CallArg("Pure", [value])], []),
+    )
+
+
+def _shared_kind() -> bcs.TransactionKind:
+    """Return a programmable TransactionKind with a shared object input."""
+    shared = bcs.SharedObjectReference(bcs.Address.from_str("0x6"), 1, False)
+    return bcs.TransactionKind(
+        "ProgrammableTransaction",
+        bcs.ProgrammableTransaction(
+            [bcs.CallArg("Object", bcs.ObjectArg("SharedObject", shared))], []
+        ),
+    )
+
+
+def _transaction(clz, result: SuiRpcResult):
+    """Return a transaction of a pure input whose execution returns result."""
+    txn = object.__new__(clz)
+    txn.builder = tx_builder.ProgrammableTransactionBuilder()
+    txn.builder.input_pure(PureInput.as_input(1))
+
+    def _execute_query_node(*, with_node, **kwargs) -> SuiRpcResult:
+        return result
+
+    async def _async_execute_query_node(*, with_node, **kwargs) -> SuiRpcResult:
+        return result
+
+    def _build_and_sign(**kwargs) -> dict:
+        return {"tx_bytestr": "AA==", "sig_array": []}
+
+    async def _async_build_and_sign(**kwargs) -> dict:
+        return _build_and_sign()
+
+    if clz is AsyncSuiTransaction:
+        txn.client = SimpleNamespace(execute_query_node=_async_execute_query_node)
+        txn.build_and_sign = _async_build_and_sign
+    else:
+        txn.client = SimpleNamespace(execute_query_node=_execute_query_node)
+        txn.build_and_sign = _build_and_sign
+    return txn
+
+
+class StubGasClient:
+    """Answers the gas QueryNodes from a list of coins, recording executions."""
+
+    def __init__(self, coins: list[pgql_type.SuiCoinObjectGQL]):
+        """."""
+        self.coins = coins
+        self.executed: list[list[str]] = []
+
+    def url(self) -> str:
+        """."""
+        return "http://stub/graphql"
+
+    def rpc_config(self) -> SimpleNamespace:
+        """."""
+        return SimpleNamespace(
+            serviceConfig=SimpleNamespace(maxPageSize=50, defaultPageSize=2)
+        )
+
+    def _result(self, qnode) -> SuiRpcResult:
+        """."""
+        if isinstance(qnode, qn.DryRunTransactionKind):
+            summary = {"computationCost": "100", "storageCost": "50"}
+            return SuiRpcResult(
+                True,
+                None,
+                SimpleNamespace(
+                    transaction_block=SimpleNamespace(
+                        effects={"gasEffects": {"gasSummary": summary}}
+                    )
+                ),
+            )
+        if isinstance(qnode, qn.GetMultipleGasObjects):
+            data = [x for x in self.coins if x.coin_object_id in qnode.coin_ids]
+        else:
+            data = self.coins
+        return SuiRpcResult(
+            True,
+            None,
+            SimpleNamespace(data=data, next_cursor=SimpleNamespace(hasNextPage=False)),
+        )
+
+    def execute_query_node(self, *, with_node, **kwargs) -> SuiRpcResult:
+        """."""
+        self.executed.append([type(with_node).__name__])
+        return self._result(with_node)
+
+    def execute_query_nodes(self, *, with_nodes, **kwargs) -> list[SuiRpcResult]:
+        """."""
+        self.executed.append([type(x).__name__ for x in with_nodes])
+        return [self._result(x) for x in with_nodes]
+
+
+class AsyncStubGasClient(StubGasClient):
+    """Async StubGasClient."""
+
+    async def execute_query_node(self, *, with_node, **kwargs) -> SuiRpcResult:
+        """."""
+        return StubGasClient.execute_query_node(self, with_node=with_node)
+
+    async def execute_query_nodes(self, *, with_nodes, **kwargs):
+        """."""
+        return StubGasClient.execute_query_nodes(self, with_nodes=with_nodes)
+
+
+def _gas_data(client: StubGasClient, tx_kind: bcs.TransactionKind, **kwargs):
+    """Return the GasData of tx_kind."""
+    return gd.get_gas_data(
+        signing=SIGNING,
+        client=client,
+        objects_in_use=set(),
+        active_gas_price=1,
+        tx_kind=tx_kind,
+        **kwargs,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_dry_run_budgets():
+    """Start each test without retained dry run budgets."""
+    gd._dry_run_budgets.clear()
+    yield
+    gd._dry_run_budgets.clear()
+
+
+def test_budget_retained():
+    """Test a dry run budget is reused with margin."""
+    client = StubGasClient([_coin(1, 10**9)])
+    assert _gas_data(client, _owned_kind()).Budget == 150
+    assert client.executed == [["GetCoinSummaries", "DryRunTransactionKind"]]
+    assert _gas_data(client, _owned_kind()).Budget == 150 + 150 * 15 // 100
+    assert client.executed[1] == ["GetCoinSummaries"]
+    # A different transaction is dry run
+    _gas_data(client, _owned_kind(2))
+    assert "DryRunTransactionKind" in client.executed[2]
+
+
+def test_budget_shared_not_retained():
+    """Test budgets of transactions with shared object inputs are not retained."""
+    client = StubGasClient([_coin(1, 10**9)])
+    for _ in range(2):
+        assert _gas_data(client, _shared_kind()).Budget == 150
+    assert all("DryRunTransactionKind" in x for x in client.executed)
+    assert not gd._dry_run_budgets
+
+
+def test_budget_cache_bound(monkeypatch):
+    """Test the least recently used budget is evicted."""
+    monkeypatch.setattr(gd, "DRY_RUN_BUDGET_CACHE_SIZE", 2)
+    client = StubGasClient([_coin(1, 10**9)])
+    for value in (1, 2, 1, 3):
+        _gas_data(client, _owned_kind(value))
+    assert len(gd._dry_run_budgets) == 2
+    client.executed.clear()
+    _gas_data(client, _owned_kind(1))
+    _gas_data(client, _owned_kind(2))
+    assert client.executed == [
+        ["GetCoinSummaries"],
+        ["GetCoinSummaries", "DryRunTransactionKind"],
+    ]
+
+
+@pytest.mark.parametrize(
+    "result,evicted",
+    [
+        (pgql_type.ExecutionResultGQL("SUCCESS", 1, "digest", "bcs"), False),
+        (pgql_type.ExecutionResultGQL("FAILURE", 1, "digest", "bcs"), True),
+        (None, True),
+    ],
+)
+def test_budget_evicted_on_failure(result, evicted):
+    """Test executing a transaction that fails evicts it's budget."""
+    txn = _transaction(SuiTransaction, SuiRpcResult(result is not None, None, result))
+    _gas_data(StubGasClient([_coin(1, 10**9)]), txn.raw_kind())
+    assert len(gd._dry_run_budgets) == 1
+    txn.execute()
+    assert len(gd._dry_run_budgets) == (0 if evicted else 1)
+
+
+@pytest.mark.asyncio
+async def test_async_budget_evicted_on_failure():
+    """Test executing an async transaction that fails evicts it's budget."""
+    failure = pgql_type.ExecutionResultGQL("FAILURE", 1, "digest", "bcs")
+    txn = _transaction(AsyncSuiTransaction, SuiRpcResult(True, None, failure))
+    _gas_data(StubGasClient([_coin(1, 10**9)]), txn.raw_kind())
+    await txn.execute()
+    assert not gd._dry_run_budgets
+
+
+@pytest.mark.asyncio
+async def test_async_budget_retained():
+    """Test an async dry run budget is reused with margin."""
+    client = AsyncStubGasClient([_coin(1, 10**9)])
+    for budget in (150, 172):
+        gas_data = await gd.async_get_gas_data(
+            signing=SIGNING,
+            client=client,
+            objects_in_use=set(),
+            active_gas_price=1,
+            tx_kind=_owned_kind(),
+        )
+        assert gas_data.Budget == budget
+
+
+def test_coins_largest_first():
+    """Test the fewest coins are selected, largest first."""
+    coins = [_coin(x, y) for x, y in enumerate([10, 20, 30, 200])]
+    selected = gd._coins_for_budget(coins, 50, True)
+    assert [x.ObjectID.to_address_str() for x in selected] == [coins[3].object_id]
+    selected = gd._coins_for_budget(coins, 50, False)
+    assert [x.ObjectID.to_address_str() for x in selected] == [
+        x.object_id for x in coins[:3]
+    ]
+    with pytest.raises(ValueError):
+        gd._coins_for_budget(coins, 261, True)
+
+
+def test_specified_coins_in_order():
+    """Test specified gas coins keep their order, less those in use."""
+    coins = [_coin(x, y) for x, y in enumerate([10, 500, 30, 500])]
+    client = StubGasClient(coins)
+    gas_data = _gas_data(client, _owned_kind(), budget=100, use_coins=coins)
+    assert [x.ObjectID.to_address_str() for x in gas_data.Payment] == [
+        x.object_id for x in coins[:2]
+    ]
+    assert not client.executed
+    gas_data = gd.get_gas_data(
+        signing=SIGNING,
+        client=client,
+        objects_in_use={coins[0].object_id},
+        active_gas_price=1,
+        tx_kind=_owned_kind(),
+        budget=100,
+        use_coins=coins,
+    )
+    assert gas_data.Payment[0].ObjectID.to_address_str() == coins[1].object_id
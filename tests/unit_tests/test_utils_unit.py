@@ -0,0 +1,123 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing coercion and validation utilities."""
+
+import pytest
+
+from pysui.sui.sui_common.validators import valid_sui_address
+from pysui.sui.sui_types.collections import SuiArray, SuiMap
+from pysui.sui.sui_types.scalars import (
+    ObjectID,
+    SuiBoolean,
+    SuiInteger,
+    SuiNullType,
+    SuiString,
+    SuiTransactionDigest,
+)
+from pysui.sui.sui_types.address import SuiAddress
+import pysui.sui.sui_utils as utils
+
+
+@pytest.mark.parametrize(
+    "coercer,in_data",
+    [
+        (utils.as_sui_address, 5),
+        (utils.as_sui_address, None),
+        (utils.as_object_id, 5),
+        (utils.as_sui_string, 1.5),
+        (utils.as_sui_integer, 1.5),
+        (utils.as_sui_array, "x"),
+        (utils.as_sui_map, [1]),
+        (utils.as_sui_txdigest, 5),
+    ],
+)
+def test_coerce_unhandled(coercer, in_data):
+    """Test types not handled by a coercer raise ValueError."""
+    with pytest.raises(ValueError):
+        coercer(in_data)
+
+
+def test_coerce_none():
+    """Test None coerces to SuiNullType where optional."""
+    assert isinstance(utils.as_object_id(None), SuiNullType)
+    assert isinstance(utils.as_sui_integer(None), SuiNullType)
+    assert utils.as_sui_map(SuiNullType()).map == {}
+
+
+def test_coerce_identity():
+    """Test instances of the target type are returned as is."""
+    address = SuiAddress("0x2")
+    for coercer, in_data in [
+        (utils.as_sui_address, address),
+        (utils.as_object_id, ObjectID("0x2")),
+        (utils.as_sui_string, SuiString("a")),
+        (utils.as_sui_integer, SuiInteger(1)),
+        (utils.as_sui_array, SuiArray([1])),
+        (utils.as_sui_boolean, SuiBoolean(True)),
+        (utils.as_sui_txdigest, SuiTransactionDigest("abc")),
+    ]:
+        assert coercer(in_data) is in_data
+
+
+def test_coerce_values():
+    """Test coercion of the handled types."""
+    assert str(utils.as_sui_address("0x2")) == "0x2"
+    assert str(utils.as_sui_address(SuiString("0x2"))) == "0x2"
+    with pytest.raises(ValueError):
+        utils.as_sui_address("0xzz")
+    assert isinstance(utils.as_object_id(SuiAddress("0x2")), ObjectID)
+    assert isinstance(utils.as_object_id(SuiString("0x2")), ObjectID)
+    assert utils.as_sui_string(5).value == "5"
+    assert utils.as_sui_string(SuiAddress("0x2")).value == "0x2"
+    assert utils.as_sui_integer("4.5").value == 4
+    assert utils.as_sui_array((1, 2)).array == [1, 2]
+    assert utils.as_sui_map({"a": 1}).map == {"a": 1}
+    assert utils.as_sui_txdigest(SuiString("abc")).value == "abc"
+    assert isinstance(utils.as_sui_map(SuiMap("", "")), SuiMap)
+
+
+def test_coerce_boolean():
+    """Test boolean coercion falls back to truthiness."""
+    assert utils.as_sui_boolean(True).value is True
+    assert utils.as_sui_boolean(0).value is False
+    assert utils.as_sui_boolean(2).value is True
+    assert utils.as_sui_boolean([]).value is False
+    assert utils.as_sui_boolean("a").value is True
+
+
+def test_valid_sui_address():
+    """Test address forms."""
+    for valid in ["0x2", "2", "0x" + "a" * 64, "A" * 64, "Immutable"]:
+        assert valid_sui_address(valid)
+    for invalid in ["", "0x", "0x" + "a" * 65, "0xg", "Mutable"]:
+        assert not valid_sui_address(invalid)
+
+
+def test_is_base_64():
+    """Test only canonical base64 is valid."""
+    for valid in ["", "QQ==", "QUI=", "QUJD", b"QUJD", bytearray(b"QQ==")]:
+        assert utils.is_base_64(valid)
+    for invalid in ["QR==", "====", "a=bc", "QUJ", "é", b"QU\nJD"]:
+        assert not utils.is_base_64(invalid)
+    with pytest.raises(ValueError):
+        utils.is_base_64(5)
+
+
+def test_int_to_listu8():
+    """Test integers are zero padded to byte count."""
+    assert utils.int_to_listu8(8, 1) == [1, 0, 0, 0, 0, 0, 0, 0]
+    assert utils.int_to_listu8(2, 65535) == [255, 255]
+    assert utils.int_to_listu8(1, 0) == [0]
+    with pytest.raises(ValueError):
+        utils.int_to_listu8(2, 65536)